@@ -6,6 +6,7 @@ Detects the current Linux distribution and determines if it's supported.
 
 from enum import Enum
 from dataclasses import dataclass
+from functools import lru_cache
 import distro
 
 
@@ -62,28 +63,13 @@ class DistroDetector:
         """
         Detect the current distribution
         
+        The result is cached for the lifetime of the process; the
+        distribution does not change while LinTune is running.
+        
         Returns:
             DistroInfo object with distribution details
         """
-        distro_id = distro.id().lower()
-        name = distro.name()
-        version = distro.version()
-        codename = distro.codename()
-        
-        # Determine if supported
-        supported = self.DISTRO_MAP.get(distro_id, SupportedDistro.UNSUPPORTED)
-        
-        # Get package manager
-        pkg_manager = self.PACKAGE_MANAGERS.get(supported, 'unknown')
-        
-        return DistroInfo(
-            distro_id=distro_id,
-            name=name,
-            version=version,
-            version_codename=codename,
-            supported=supported,
-            package_manager=pkg_manager
-        )
+        return detect_distro()
     
     def get_distro_icon(self, info: DistroInfo) -> str:
         """
@@ -104,3 +90,31 @@ class DistroDetector:
         }
         return icons.get(info.supported, "❓")
 
+
+@lru_cache(maxsize=1)
+def detect_distro() -> DistroInfo:
+    """
+    Detect the current distribution once per process
+    
+    Returns:
+        DistroInfo object with distribution details
+    """
+    distro_id = distro.id().lower()
+    name = distro.name()
+    version = distro.version()
+    codename = distro.codename()
+    
+    # Determine if supported
+    supported = DistroDetector.DISTRO_MAP.get(distro_id, SupportedDistro.UNSUPPORTED)
+    
+    # Get package manager
+    pkg_manager = DistroDetector.PACKAGE_MANAGERS.get(supported, 'unknown')
+    
+    return DistroInfo(
+        distro_id=distro_id,
+        name=name,
+        version=version,
+        version_codename=codename,
+        supported=supported,
+        package_manager=pkg_manager
+    )
@@ -8,6 +8,7 @@ from enum import Enum
 from dataclasses import dataclass
 from typing import Optional, Callable
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import shutil
 
 from .distro import DistroDetector, DistroInfo, SupportedDistro
@@ -63,6 +64,7 @@ class Installer:
             progress_callback: Optional callback for progress updates
         """
         self.progress_callback = progress_callback
+        self._cancelled = False
         
         # Initialize components
         self.distro_detector = DistroDetector()
@@ -99,6 +101,10 @@ class Installer:
         if self.progress_callback:
             self.progress_callback(self.current_progress)
     
+    def cancel(self):
+        """Stop the installation before its next step"""
+        self._cancelled = True
+    
     def _on_build_progress(self, build_progress: BuildProgress):
         """Handle build progress updates"""
         self._update_progress(
@@ -211,7 +217,10 @@ class Installer:
         deps = get_himmelblau_dependencies(self.distro_info.supported)
         
         # Check what's already installed
-        missing = [dep for dep in deps if not self.package_manager.is_installed(dep)]
+        # Each check is a separate subprocess, so run them concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            installed = executor.map(self.package_manager.is_installed, deps)
+            missing = [dep for dep, ok in zip(deps, installed) if not ok]
         
         if not missing:
             self._update_progress(InstallStep.INSTALL_DEPS, 3, "All dependencies installed")
@@ -404,6 +413,14 @@ class Installer:
         ]
         
         for step_name, step_func in steps:
+            if self._cancelled:
+                self._update_progress(
+                    self.current_progress.current_step,
+                    self.current_progress.step_number,
+                    "Installation cancelled",
+                    InstallStatus.CANCELLED
+                )
+                return False
             if not step_func():
                 return False
         
@@ -7,6 +7,7 @@ Handles package installation across different distributions.
 import subprocess
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from .distro import SupportedDistro
@@ -186,10 +187,13 @@ PACKAGE_MAP = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_package_manager(distro: SupportedDistro) -> Optional[PackageManager]:
     """
     Factory function to get the appropriate package manager
     
+    Managers are stateless, so one shared instance is returned per distro.
+    
     Args:
         distro: Distribution type
         
@@ -4,19 +4,53 @@ Dashboard view for LinTune
 Main overview with system status cards and enrollment options
 """
 
+from functools import lru_cache
+
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QGridLayout, QScrollArea
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont, QIcon, QPixmap, QPainter
 
 from ..core.distro import DistroInfo
 from ..core.validator import SystemStatus
+from ..utils.logger import get_logger
 from .widgets import RefreshButton, StatusDot
 from .dialogs import DomainInputDialog, InstallProgressDialog, SudoPasswordDialog
 
 
+logger = get_logger(__name__)
+
+QUICK_ACTION_ICON_SIZE = 18
+# Icons are rendered at this scale so they stay sharp on HiDPI screens
+_ICON_SCALE = 2
+
+
+@lru_cache(maxsize=None)
+def _render_emoji_icon(glyph: str, size: int = QUICK_ACTION_ICON_SIZE) -> QIcon:
+    """
+    Rasterize an emoji glyph into a cached QIcon
+    
+    The emoji font fallback is only hit once per glyph; every later paint
+    blits the pixmap. Created lazily since pixmaps need a QApplication.
+    Monochrome glyphs like "✓" take the button text color.
+    """
+    pixmap = QPixmap(size * _ICON_SCALE, size * _ICON_SCALE)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setPen(QApplication.palette().buttonText().color())
+    font = QFont()
+    font.setPixelSize((size - 2) * _ICON_SCALE)
+    painter.setFont(font)
+    painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, glyph)
+    painter.end()
+    pixmap.setDevicePixelRatio(_ICON_SCALE)
+    
+    return QIcon(pixmap)
+
+
 class StatusCard(QFrame):
     """Individual status card widget"""
     
@@ -175,6 +209,16 @@ class ActionCard(QFrame):
 class EnrollmentProgressCard(QFrame):
     """Card showing enrollment progress"""
     
+    # Step dot and connector styles by completion - semantic colors: green for done, gray for pending
+    _DOT_STYLES = {
+        done: f"color: {StatusDot.COLORS['success' if done else 'neutral']}; font-size: 16px;"
+        for done in (True, False)
+    }
+    _LINE_STYLES = {
+        done: f"color: {StatusDot.COLORS['success' if done else 'neutral']}; font-size: 10px;"
+        for done in (True, False)
+    }
+    
     def __init__(self, status: SystemStatus):
         super().__init__()
         self.setProperty("class", "card")
@@ -208,16 +252,14 @@ class EnrollmentProgressCard(QFrame):
         dots_layout = QHBoxLayout()
         dots_layout.setSpacing(0)
         for i, (step_name, completed) in enumerate(steps):
-            # Semantic colors: green for done, gray for pending
             dot = "●" if completed else "○"
-            dot_color = StatusDot.COLORS['success'] if completed else StatusDot.COLORS['neutral']
             
             step_layout = QVBoxLayout()
             step_layout.setSpacing(2)
             
             dot_label = QLabel(dot)
             dot_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            dot_label.setStyleSheet(f"color: {dot_color}; font-size: 16px;")
+            dot_label.setStyleSheet(self._DOT_STYLES[bool(completed)])
             step_layout.addWidget(dot_label)
             
             # Text uses palette color (no semantic color for text)
@@ -232,8 +274,7 @@ class EnrollmentProgressCard(QFrame):
             if i < len(steps) - 1:
                 line = QLabel("───")
                 line.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                line_color = dot_color if completed else StatusDot.COLORS['neutral']
-                line.setStyleSheet(f"color: {line_color}; font-size: 10px;")
+                line.setStyleSheet(self._LINE_STYLES[bool(completed)])
                 dots_layout.addWidget(line)
         
         layout.addLayout(dots_layout)
@@ -351,25 +392,24 @@ class DashboardView(QWidget):
             # Intune Status card (use centralized detection)
             intune = self.system_status.intune_status
             
-            # Determine enrollment status badge
+            # Display strings are computed properties - read each once
+            enrollment_text = intune.display_enrollment if intune else "Unknown"
+            compliance_text = intune.display_compliance if intune else "Unknown"
+            
+            # Determine status badges
             if intune and intune.is_enrolled:
                 enrollment_status = 'success'
-            elif intune and 'limit' in intune.display_enrollment.lower():
-                enrollment_status = 'warning'
             else:
-                enrollment_status = 'neutral'
+                enrollment_status = 'warning' if 'limit' in enrollment_text.lower() else 'neutral'
             
-            # Determine compliance status badge  
             if intune and intune.is_compliant:
                 compliance_status = 'success'
-            elif intune and intune.display_compliance == 'N/A':
-                compliance_status = 'neutral'
             else:
-                compliance_status = 'warning'
+                compliance_status = 'neutral' if compliance_text == 'N/A' else 'warning'
             
             intune_items = [
-                ("Enrollment", intune.display_enrollment if intune else "Unknown", enrollment_status),
-                ("Compliance", intune.display_compliance if intune else "Unknown", compliance_status),
+                ("Enrollment", enrollment_text, enrollment_status),
+                ("Compliance", compliance_text, compliance_status),
                 ("Service", intune.last_activity if intune and intune.last_activity else "Unknown", 'success'),
             ]
             intune_card = StatusCard("Intune Status", intune_items)
@@ -422,21 +462,26 @@ class DashboardView(QWidget):
             """
             
             # Sync Now button
-            sync_btn = QPushButton("🔄  Sync Now")
+            icon_size = QSize(QUICK_ACTION_ICON_SIZE, QUICK_ACTION_ICON_SIZE)
+            
+            sync_btn = QPushButton(_render_emoji_icon("🔄"), "  Sync Now")
+            sync_btn.setIconSize(icon_size)
             sync_btn.setCursor(Qt.CursorShape.PointingHandCursor)
             sync_btn.setStyleSheet(action_btn_style)
             sync_btn.clicked.connect(self.on_sync_clicked)
             actions_layout.addWidget(sync_btn)
             
             # View Logs button
-            logs_btn = QPushButton("📄  View Logs")
+            logs_btn = QPushButton(_render_emoji_icon("📄"), "  View Logs")
+            logs_btn.setIconSize(icon_size)
             logs_btn.setCursor(Qt.CursorShape.PointingHandCursor)
             logs_btn.setStyleSheet(action_btn_style)
             logs_btn.clicked.connect(lambda: self.navigate_requested.emit(3))  # Logs view index
             actions_layout.addWidget(logs_btn)
             
             # Check Status button (go to Device view)
-            status_btn = QPushButton("✓  Check Status")
+            status_btn = QPushButton(_render_emoji_icon("✓"), "  Check Status")
+            status_btn.setIconSize(icon_size)
             status_btn.setCursor(Qt.CursorShape.PointingHandCursor)
             status_btn.setStyleSheet(action_btn_style)
             status_btn.clicked.connect(lambda: self.navigate_requested.emit(1))  # Device view index
@@ -455,7 +500,8 @@ class DashboardView(QWidget):
     def on_refresh_clicked(self):
         """Handle refresh button click"""
         self.refresh_btn.start_refresh()
-        self.refresh_requested.emit()
+        # The refresh blocks in validate(); let the busy state paint first
+        QTimer.singleShot(0, self.refresh_requested.emit)
     
     def on_sync_clicked(self):
         """Handle Sync Now button click - uses native aad-tool cache-clear"""
@@ -489,30 +535,30 @@ class DashboardView(QWidget):
         self.checked_label.setText(f"Checked: {datetime.now().strftime('%H:%M:%S')}")
         # Finish refresh button animation
         self.refresh_btn.finish_refresh()
-        print(f"Dashboard updated: {system_status.enrollment_status}")
+        logger.debug("Dashboard updated: %s", system_status.enrollment_status)
     
     def start_enrollment(self, mode: str):
         """Start the enrollment process"""
-        print(f"[DEBUG] start_enrollment called with mode: {mode}")
+        logger.debug("start_enrollment called with mode: %s", mode)
         if mode == "auto":
             # First, show sudo password dialog
-            print("[DEBUG] Showing sudo password dialog...")
+            logger.debug("Showing sudo password dialog...")
             sudo_dialog = SudoPasswordDialog(self)
             result = sudo_dialog.exec()
-            print(f"[DEBUG] Sudo dialog result: {result}")
+            logger.debug("Sudo dialog result: %s", result)
             if result != SudoPasswordDialog.DialogCode.Accepted:
-                print("[DEBUG] Sudo dialog cancelled")
+                logger.debug("Sudo dialog cancelled")
                 return  # User cancelled
             
-            print("[DEBUG] Sudo password validated, showing domain dialog...")
+            logger.debug("Sudo password validated, showing domain dialog...")
             # Show domain dialog
             dialog = DomainInputDialog(self)
             result = dialog.exec()
-            print(f"[DEBUG] Domain dialog result: {result}, domain: {dialog.domain}")
+            logger.debug("Domain dialog result: %s, domain: %s", result, dialog.domain)
             if result == DomainInputDialog.DialogCode.Accepted:
-                print(f"[DEBUG] Starting installation for domain: {dialog.domain}")
+                logger.debug("Starting installation for domain: %s", dialog.domain)
                 # Start installation
-                progress_dialog = InstallProgressDialog(
+                progress_dialog = InstallProgressDialog.get_instance(
                     dialog.domain, 
                     dialog.grant_sudo, 
                     self
@@ -522,5 +568,5 @@ class DashboardView(QWidget):
                 # Refresh status after installation
                 self.refresh_requested.emit()
             else:
-                print("[DEBUG] Domain dialog cancelled or rejected")
+                logger.debug("Domain dialog cancelled or rejected")
 
@@ -4,30 +4,463 @@ Devices view for LinTune
 Shows device information and enrollment status.
 """
 
-import subprocess
+import fcntl
+import functools
 import socket
-import platform
+import struct
 import os
+import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QGridLayout, QSizePolicy
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+    QGridLayout, QSizePolicy, QFrame
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtGui import QFont
 
-from ..core.validator import SystemValidator
+from ..core.validator import SystemValidator, SystemStatus, IntuneStatus
 from .widgets import RefreshButton, StatusDot
 
+try:
+    from systemd import journal
+except ImportError:  # python-systemd is optional
+    journal = None
+
+
+# Parsed once when the view is built; rows only carry an object name
+_STYLE = """
+    QLabel#infoLabel, QLabel#infoValue {
+        font-size: 13px;
+    }
+"""
+
+
+# Kernel identity does not change while we run
+_UNAME = os.uname()
+
+
+def _ttl_cache(seconds: float):
+    """
+    Cache a no-argument function's result for the given number of seconds
+    
+    Exceptions are not cached, so a failing read is retried next time.
+    """
+    def decorator(func):
+        cell = None  # (expiry, value)
+        
+        @functools.wraps(func)
+        def wrapper():
+            nonlocal cell
+            now = time.monotonic()
+            if cell is None or now >= cell[0]:
+                cell = (now + seconds, func())
+            return cell[1]
+        
+        return wrapper
+    return decorator
+
+
+# Host names rarely change, but getfqdn() can block on reverse DNS
+HOSTNAME_CACHE_TTL = 60.0
+
+# OS, memory, CPU and resolvers practically never change between refreshes
+STATIC_INFO_CACHE_TTL = 300.0
+
+
+@_ttl_cache(HOSTNAME_CACHE_TTL)
+def _cached_hostname() -> str:
+    """Get the hostname, cached for HOSTNAME_CACHE_TTL seconds"""
+    try:
+        return socket.gethostname()
+    except OSError:
+        return _UNAME.nodename
+
+
+@_ttl_cache(HOSTNAME_CACHE_TTL)
+def _cached_fqdn() -> str:
+    """Get the fully qualified domain name, cached for HOSTNAME_CACHE_TTL seconds"""
+    return socket.getfqdn()
+
+
+SIOCGIFADDR = 0x8915
+
+
+def _probe_primary_ip() -> str:
+    """
+    Get the IPv4 address of the interface carrying the default route
+    
+    Asks the kernel via the SIOCGIFADDR ioctl, so no network traffic or
+    DNS is involved. Raises OSError if there is no usable default route.
+    """
+    route = _read_default_route()
+    if route is None:
+        raise OSError("No default route")
+    iface = route[0]
+    
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        ifreq = fcntl.ioctl(s.fileno(), SIOCGIFADDR, struct.pack('256s', iface[:15].encode()))
+    # struct ifreq: 16 byte name, then sockaddr_in (family, port, addr)
+    return socket.inet_ntoa(ifreq[20:24])
+
+
+@_ttl_cache(HOSTNAME_CACHE_TTL)
+def _cached_primary_ip() -> str:
+    """Get the primary IP address, cached for HOSTNAME_CACHE_TTL seconds"""
+    try:
+        return _probe_primary_ip()
+    except OSError:
+        # Fallback: resolve our own hostname
+        return socket.gethostbyname(_cached_hostname())
+
+
+# Matched against the raw bytes of /proc files
+_MEM_RE = re.compile(rb"^MemTotal:\s+(\d+)", re.M)
+_CPU_RE = re.compile(rb"^model name\s*:\s*(.+)$", re.M)
+
+
+@_ttl_cache(STATIC_INFO_CACHE_TTL)
+def _read_os_name() -> str | None:
+    """Get PRETTY_NAME from /etc/os-release"""
+    with open("/etc/os-release") as f:
+        m = re.search(r'^PRETTY_NAME=(.*)$', f.read(), re.M)
+    return m.group(1).strip().strip('"') if m else None
+
+
+@_ttl_cache(STATIC_INFO_CACHE_TTL)
+def _read_mem_gb() -> str | None:
+    """Get total memory, e.g. "15.5 GB" """
+    with open("/proc/meminfo", "rb") as f:
+        # MemTotal is the first line
+        m = _MEM_RE.search(f.read(1024))
+    if not m:
+        return None
+    mem_gb = int(m.group(1)) / 1024 / 1024
+    return f"{mem_gb:.1f} GB"
+
+
+@_ttl_cache(STATIC_INFO_CACHE_TTL)
+def _read_cpu_name() -> str | None:
+    """Get the CPU model name, truncated for display"""
+    with open("/proc/cpuinfo", "rb") as f:
+        # The first processor block is enough
+        m = _CPU_RE.search(f.read(4096))
+    if not m:
+        return None
+    cpu_name = m.group(1).decode(errors="replace").strip()
+    # Truncate long CPU names
+    if len(cpu_name) > 40:
+        cpu_name = cpu_name[:37] + "..."
+    return cpu_name
+
+
+@_ttl_cache(STATIC_INFO_CACHE_TTL)
+def _read_dns_servers() -> tuple[str, ...]:
+    """Get the nameservers listed in /etc/resolv.conf"""
+    resolv_path = Path("/etc/resolv.conf")
+    if not resolv_path.exists():
+        return ()
+    with open(resolv_path) as f:
+        return tuple(line.split()[1] for line in f if line.startswith("nameserver"))
+
+
+RTF_GATEWAY = 0x2
+
+
+def _read_default_route() -> tuple[str, str] | None:
+    """
+    Get the (interface, gateway) of the IPv4 default route
+    
+    Reads /proc/net/route directly instead of spawning `ip route`.
+    Addresses are little-endian hex, e.g. 0101A8C0 -> 192.168.1.1
+    """
+    with open("/proc/net/route") as f:
+        next(f)  # Header
+        for line in f:
+            fields = line.split()
+            if len(fields) < 4:
+                continue
+            # Iface Destination Gateway Flags ...
+            if fields[1] == "00000000" and int(fields[3], 16) & RTF_GATEWAY:
+                return fields[0], socket.inet_ntoa(bytes.fromhex(fields[2])[::-1])
+    return None
+
+
+def _read_default_gateway() -> str | None:
+    """Get the IPv4 default gateway from the kernel routing table"""
+    route = _read_default_route()
+    return route[1] if route else None
+
+
+# Per unit, kept open between refreshes; only used from the refresh worker thread
+_journal_readers: dict = {}
+
+
+def _read_last_journal_activity(unit: str) -> str | None:
+    """
+    Get the time of the latest journal entry of a unit, e.g. "2024-01-15 10:30"
+    
+    Uses the sd-journal API when python-systemd is available and falls
+    back to running journalctl otherwise.
+    """
+    if journal is None:
+        return _run_last_journal_activity(unit)
+    
+    reader = _journal_readers.get(unit)
+    if reader is None:
+        reader = _journal_readers[unit] = journal.Reader()
+        reader.add_match(_SYSTEMD_UNIT=f"{unit}.service")
+    else:
+        reader.process()  # Pick up rotated journal files
+    
+    reader.seek_tail()
+    entry = reader.get_previous()
+    if not entry:
+        return None
+    return entry["__REALTIME_TIMESTAMP"].strftime("%Y-%m-%d %H:%M")
+
+
+def _run_last_journal_activity(unit: str) -> str | None:
+    """journalctl based fallback for _read_last_journal_activity"""
+    import subprocess  # Only needed without python-systemd
+    
+    result = subprocess.run(
+        ["journalctl", "-u", unit, "-n", "1", "--no-pager", 
+         "-o", "short-iso", "--output-fields=__REALTIME_TIMESTAMP"],
+        capture_output=True, text=True, timeout=5
+    )
+    if result.returncode != 0:
+        return None
+    
+    for line in result.stdout.strip().split('\n'):
+        if line and not line.startswith('--'):
+            # Format: 2024-01-15T10:30:45+0000 hostname...
+            timestamp = line.split()[0]
+            if 'T' in timestamp:
+                date_part, time_part = timestamp.split('T', 1)
+                time_part = time_part.split('+')[0].split('-')[0][:5]
+                return f"{date_part} {time_part}"
+            break
+    return None
+
+
+@dataclass
+class DeviceSnapshot:
+    """Device information collected off the GUI thread"""
+    
+    # Device
+    hostname: str = ""
+    os_name: str = "Unknown"
+    kernel: str = ""
+    architecture: str = ""
+    uptime: str | None = None
+    memory: str | None = None
+    cpu: str | None = None
+    
+    # Network
+    fqdn: str = ""
+    ip_address: str = "Unknown"
+    gateway: str | None = None
+    dns_servers: list[str] = field(default_factory=list)
+    
+    # Enrollment / compliance
+    status: SystemStatus | None = None
+    daemon_ok: bool = False
+    daemon_msg: str = ""
+    intune: IntuneStatus | None = None
+    last_activity: str | None = None
+
+
+class DeviceInfoWorker(QThread):
+    """Worker thread collecting device information"""
+    
+    loaded = pyqtSignal(object)  # DeviceSnapshot
+    
+    def __init__(self, validator: SystemValidator):
+        super().__init__()
+        self.validator = validator
+    
+    def run(self):
+        snapshot = DeviceSnapshot()
+        
+        # The slow, independent checks run side by side, so a refresh takes
+        # as long as the slowest of them rather than their sum
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            # Validate once per refresh - shared by the enrollment and compliance grids
+            status_future = pool.submit(self.validator.validate)
+            daemon_future = pool.submit(self.validator.check_aad_tool_status)
+            
+            self._collect_device_info(snapshot)
+            self._collect_network_info(snapshot)
+            
+            snapshot.status = status_future.result()
+            # The last check-in is only shown for an enrolled device
+            activity_future = None
+            if snapshot.status.is_fully_configured:
+                activity_future = pool.submit(_read_last_journal_activity, "himmelblaud")
+            self._collect_enrollment_info(snapshot, daemon_future)
+            self._collect_compliance_info(snapshot, activity_future)
+        
+        self.loaded.emit(snapshot)
+    
+    def _collect_device_info(self, snapshot: DeviceSnapshot):
+        """Collect device hardware/OS info"""
+        snapshot.hostname = _cached_hostname()
+        
+        # OS
+        try:
+            snapshot.os_name = _read_os_name() or snapshot.os_name
+        except Exception:
+            snapshot.os_name = _UNAME.sysname
+        
+        snapshot.kernel = _UNAME.release
+        snapshot.architecture = _UNAME.machine
+        
+        # Uptime
+        try:
+            with open("/proc/uptime") as f:
+                # e.g. "350735.47 1234567.89", whole seconds are enough
+                uptime_seconds = int(f.read(32).split(".", 1)[0])
+            days, rem = divmod(uptime_seconds, 86400)
+            hours, rem = divmod(rem, 3600)
+            minutes = rem // 60
+            if days > 0:
+                snapshot.uptime = f"{days}d {hours}h {minutes}m"
+            else:
+                snapshot.uptime = f"{hours}h {minutes}m"
+        except Exception:
+            pass
+        
+        # Memory
+        try:
+            snapshot.memory = _read_mem_gb()
+        except Exception:
+            pass
+        
+        # CPU
+        try:
+            snapshot.cpu = _read_cpu_name()
+        except Exception:
+            pass
+    
+    def _collect_network_info(self, snapshot: DeviceSnapshot):
+        """Collect network information"""
+        snapshot.fqdn = _cached_fqdn()
+        
+        # Primary IP Address
+        try:
+            snapshot.ip_address = _cached_primary_ip()
+        except Exception:
+            pass
+        
+        # Default gateway
+        try:
+            snapshot.gateway = _read_default_gateway()
+        except Exception:
+            pass
+        
+        # DNS servers
+        try:
+            snapshot.dns_servers = list(_read_dns_servers())
+        except Exception:
+            pass
+    
+    def _collect_enrollment_info(self, snapshot: DeviceSnapshot, daemon_future: Future):
+        """Collect enrollment status"""
+        # aad-tool status (native check)
+        snapshot.daemon_ok, snapshot.daemon_msg = daemon_future.result()
+    
+    def _collect_compliance_info(self, snapshot: DeviceSnapshot, activity_future: Future | None):
+        """Collect compliance status"""
+        if not snapshot.status.is_fully_configured:
+            return
+        
+        # Intune status was already computed by validate()
+        snapshot.intune = snapshot.status.intune_status
+        
+        # Last check-in (from journal)
+        try:
+            snapshot.last_activity = activity_future.result()
+        except Exception:
+            pass
+
+
+# (label, value, status) of one info grid row
+RowSpec = tuple[str, str, str | None]
+
+
+class _InfoRow:
+    """Label and value widgets making up one row of an info grid"""
+    
+    def __init__(self, label: str):
+        self._value = None
+        self._status = None
+        
+        # Label - fixed width, no wrap
+        self.label = QLabel(label)
+        self.label.setObjectName("infoLabel")
+        self.label.setFixedWidth(110)
+        
+        # Value with optional status indicator (badge before text)
+        self.value = QWidget()
+        value_layout = QHBoxLayout(self.value)
+        value_layout.setContentsMargins(0, 0, 0, 0)
+        value_layout.setSpacing(6)
+        
+        # Status badge (semantic colors), hidden for plain rows
+        self.dot = StatusDot()
+        self.dot.setVisible(False)
+        value_layout.addWidget(self.dot)
+        
+        # Text (neutral color - no semantic color on text)
+        self.text = QLabel()
+        self.text.setObjectName("infoValue")
+        self.text.setWordWrap(False)
+        self.text.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        value_layout.addWidget(self.text)
+        value_layout.addStretch()
+        
+        self.value.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        self.value.setMinimumWidth(200)
+    
+    def update(self, value: str, status: str = None):
+        """Show new value text and status, skipping unchanged parts"""
+        if value != self._value:
+            self._value = value
+            self.text.setText(value)
+        if status != self._status:
+            self._status = status
+            if status:
+                self.dot.set_status(status)
+            self.dot.setVisible(bool(status))
+    
+    def setVisible(self, visible: bool):
+        self.label.setVisible(visible)
+        self.value.setVisible(visible)
+
 
 class DevicesView(QWidget):
     """Device information view"""
     
+    # Built on first use, QFont needs a running QApplication
+    _header_font: QFont | None = None
+    
     def __init__(self):
         super().__init__()
         self.validator = SystemValidator()
+        self.worker = None
+        self._refreshing = False
+        # Per grid: label -> row widgets, and the labels currently shown
+        self._grid_rows: dict[int, dict[str, _InfoRow]] = {}
+        self._grid_labels: dict[int, list[str]] = {}
+        QApplication.instance().aboutToQuit.connect(self._stop_worker)
         self.init_ui()
     
     def init_ui(self):
+        self.setStyleSheet(_STYLE)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
         layout.setSpacing(20)
@@ -35,7 +468,7 @@ class DevicesView(QWidget):
         # Header
         header_layout = QHBoxLayout()
         title = QLabel("Device")
-        title.setStyleSheet("font-size: 24px; font-weight: 600; ")
+        title.setObjectName("viewTitle")
         header_layout.addWidget(title)
         header_layout.addStretch()
         
@@ -92,18 +525,33 @@ class DevicesView(QWidget):
         # Load data
         self.refresh()
     
-    def _create_section_header(self, text: str) -> QLabel:
-        """Create a blue uppercase section header"""
+    def _create_section_header(self, text: str) -> QWidget:
+        """Create a blue uppercase section header with a rule below it"""
+        # Shared QFont for the text; colors come from fluent.qss, where the
+        # global QLabel color rule would override a palette role
+        if DevicesView._header_font is None:
+            font = QFont(self.font())
+            font.setPixelSize(11)
+            font.setWeight(QFont.Weight.Bold)
+            font.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, 1)
+            DevicesView._header_font = font
+        
+        header = QWidget()
+        header_layout = QVBoxLayout(header)
+        header_layout.setContentsMargins(0, 0, 0, 0)
+        header_layout.setSpacing(8)
+        
         label = QLabel(text)
-        label.setStyleSheet("""
-            font-size: 11px;
-            font-weight: 700;
-            color: palette(highlight);
-            letter-spacing: 1px;
-            padding-bottom: 8px;
-            border-bottom: 1px solid palette(mid);
-        """)
-        return label
+        label.setFont(DevicesView._header_font)
+        label.setObjectName("deviceSectionHeader")
+        header_layout.addWidget(label)
+        
+        line = QFrame()
+        line.setObjectName("deviceSectionRule")
+        line.setFixedHeight(1)
+        header_layout.addWidget(line)
+        
+        return header
     
     def _create_info_grid(self) -> QGridLayout:
         """Create an info grid layout"""
@@ -113,297 +561,174 @@ class DevicesView(QWidget):
         grid.setColumnStretch(1, 1)  # Value column - stretch
         return grid
     
-    def _clear_grid(self, grid: QGridLayout):
-        """Clear all widgets from a grid"""
-        while grid.count():
-            item = grid.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-    
-    def _add_info_row(self, grid: QGridLayout, row: int, label: str, value: str, 
-                      status: str = None) -> int:
+    def _update_grid(self, grid: QGridLayout, rows: list[RowSpec]):
         """
-        Add an info row to the grid
+        Show the given rows in a grid, touching only what changed
+        
+        Rows are keyed by their label. Rows that are no longer wanted are
+        hidden, new ones are created, and existing ones only get their
+        text/status updated. Widgets are only moved when the set or order
+        of labels changes.
         
         Args:
             grid: Target grid layout
-            row: Row index
-            label: Label text
-            value: Value text
-            status: Optional status indicator ('success', 'warning', 'error', 'pending')
-        
-        Returns:
-            Next row index
+            rows: (label, value, status) tuples in display order, where
+                  status is None or 'success', 'warning', 'error', 'pending'
         """
-        # Label - fixed width, no wrap
-        label_widget = QLabel(label)
-        label_widget.setStyleSheet("font-size: 13px; ")
-        label_widget.setFixedWidth(110)
-        
-        # Value with optional status indicator (badge before text)
-        if status:
-            # Create container for badge + text
-            value_widget = QWidget()
-            value_layout = QHBoxLayout(value_widget)
-            value_layout.setContentsMargins(0, 0, 0, 0)
-            value_layout.setSpacing(6)
+        current = self._grid_rows.setdefault(id(grid), {})
+        labels = [label for label, _, _ in rows]
+        
+        for label in current.keys() - set(labels):
+            current[label].setVisible(False)
+        
+        relayout = labels != self._grid_labels.get(id(grid))
+        for row, (label, value, status) in enumerate(rows):
+            info_row = current.get(label)
+            if info_row is None:
+                info_row = current[label] = _InfoRow(label)
+            elif relayout:
+                grid.removeWidget(info_row.label)
+                grid.removeWidget(info_row.value)
             
-            # Status badge (semantic colors)
-            status_dot = StatusDot(status)
-            value_layout.addWidget(status_dot)
+            if relayout:
+                grid.addWidget(info_row.label, row, 0, Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+                grid.addWidget(info_row.value, row, 1, Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+                info_row.setVisible(True)
             
-            # Text (neutral color - no semantic color on text)
-            value_label = QLabel(value)
-            value_label.setStyleSheet("font-size: 13px;")
-            value_label.setWordWrap(False)
-            value_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-            value_layout.addWidget(value_label)
-            value_layout.addStretch()
-            
-            value_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-            value_widget.setMinimumWidth(200)
-        else:
-            value_widget = QLabel(value)
-            value_widget.setStyleSheet("font-size: 13px;")
-            value_widget.setWordWrap(False)
-            value_widget.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-            value_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-            value_widget.setMinimumWidth(200)
-        
-        grid.addWidget(label_widget, row, 0, Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
-        grid.addWidget(value_widget, row, 1, Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+            info_row.update(value, status)
         
-        return row + 1
+        self._grid_labels[id(grid)] = labels
     
     def on_refresh_clicked(self):
         """Handle refresh button click with visual feedback"""
+        if self._refreshing:
+            return  # Ignore impatient clicks while a refresh is in flight
         self.refresh_btn.start_refresh()
         self.refresh()
-        self.refresh_btn.finish_refresh()
     
     def refresh(self):
-        """Refresh all device information"""
-        self.load_device_info()
-        self.load_network_info()
-        self.load_enrollment_info()
-        self.load_compliance_info()
+        """Refresh all device information in a background thread"""
+        if self._refreshing:
+            return  # Results of the running refresh will be shown
+        self._refreshing = True
+        
+        self.worker = DeviceInfoWorker(self.validator)
+        self.worker.loaded.connect(self.on_snapshot_loaded)
+        self.worker.finished.connect(self.on_refresh_finished)
+        self.worker.start()
     
-    def load_device_info(self):
-        """Load device hardware/OS info"""
-        self._clear_grid(self.device_grid)
-        row = 0
-        
-        # Hostname
-        row = self._add_info_row(self.device_grid, row, "Hostname", socket.gethostname())
-        
-        # OS
-        os_name = "Unknown"
+    def on_snapshot_loaded(self, snapshot: DeviceSnapshot):
+        """Populate the grids with freshly collected data"""
+        # Repaint once after all grids are updated, not per changed row
+        self.setUpdatesEnabled(False)
         try:
-            with open("/etc/os-release") as f:
-                for line in f:
-                    if line.startswith("PRETTY_NAME="):
-                        os_name = line.split("=", 1)[1].strip().strip('"')
-                        break
-        except Exception:
-            os_name = platform.system()
-        row = self._add_info_row(self.device_grid, row, "Operating System", os_name)
-        
-        # Kernel
-        row = self._add_info_row(self.device_grid, row, "Kernel", platform.release())
-        
-        # Architecture
-        row = self._add_info_row(self.device_grid, row, "Architecture", platform.machine())
+            self.load_device_info(snapshot)
+            self.load_network_info(snapshot)
+            self.load_enrollment_info(snapshot)
+            self.load_compliance_info(snapshot)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def on_refresh_finished(self):
+        """Allow the next refresh once the worker thread is done"""
+        self._refreshing = False
+        if self.refresh_btn.is_refreshing:
+            self.refresh_btn.finish_refresh()
+    
+    def _stop_worker(self):
+        """Let a running refresh finish before the application exits"""
+        if self.worker is not None:
+            self.worker.wait()  # Its checks are bounded by their own timeouts
+    
+    def load_device_info(self, snapshot: DeviceSnapshot):
+        """Load device hardware/OS info"""
+        rows: list[RowSpec] = []
         
-        # Uptime
-        try:
-            with open("/proc/uptime") as f:
-                uptime_seconds = float(f.read().split()[0])
-                days = int(uptime_seconds // 86400)
-                hours = int((uptime_seconds % 86400) // 3600)
-                minutes = int((uptime_seconds % 3600) // 60)
-                if days > 0:
-                    uptime_str = f"{days}d {hours}h {minutes}m"
-                else:
-                    uptime_str = f"{hours}h {minutes}m"
-                row = self._add_info_row(self.device_grid, row, "Uptime", uptime_str)
-        except Exception:
-            pass
+        rows.append(("Hostname", snapshot.hostname, None))
+        rows.append(("Operating System", snapshot.os_name, None))
+        rows.append(("Kernel", snapshot.kernel, None))
+        rows.append(("Architecture", snapshot.architecture, None))
         
-        # Memory
-        try:
-            with open("/proc/meminfo") as f:
-                for line in f:
-                    if line.startswith("MemTotal:"):
-                        mem_kb = int(line.split()[1])
-                        mem_gb = mem_kb / 1024 / 1024
-                        row = self._add_info_row(self.device_grid, row, "Memory", f"{mem_gb:.1f} GB")
-                        break
-        except Exception:
-            pass
+        if snapshot.uptime:
+            rows.append(("Uptime", snapshot.uptime, None))
+        if snapshot.memory:
+            rows.append(("Memory", snapshot.memory, None))
+        if snapshot.cpu:
+            rows.append(("CPU", snapshot.cpu, None))
         
-        # CPU
-        try:
-            with open("/proc/cpuinfo") as f:
-                for line in f:
-                    if line.startswith("model name"):
-                        cpu_name = line.split(":", 1)[1].strip()
-                        # Truncate long CPU names
-                        if len(cpu_name) > 40:
-                            cpu_name = cpu_name[:37] + "..."
-                        row = self._add_info_row(self.device_grid, row, "CPU", cpu_name)
-                        break
-        except Exception:
-            pass
+        self._update_grid(self.device_grid, rows)
     
-    def load_network_info(self):
+    def load_network_info(self, snapshot: DeviceSnapshot):
         """Load network information"""
-        self._clear_grid(self.network_grid)
-        row = 0
+        rows: list[RowSpec] = []
         
-        # Hostname FQDN
-        fqdn = socket.getfqdn()
-        row = self._add_info_row(self.network_grid, row, "FQDN", fqdn)
+        rows.append(("FQDN", snapshot.fqdn, None))
+        rows.append(("IP Address", snapshot.ip_address, None))
         
-        # Primary IP Address
-        ip = "Unknown"
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.settimeout(1)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
-        except Exception:
-            # Fallback: try to get any non-loopback IP
-            try:
-                hostname = socket.gethostname()
-                ip = socket.gethostbyname(hostname)
-            except Exception:
-                pass
-        row = self._add_info_row(self.network_grid, row, "IP Address", ip)
-        
-        # Default gateway
-        try:
-            result = subprocess.run(
-                ["ip", "route", "show", "default"],
-                capture_output=True, text=True, timeout=2
-            )
-            if result.returncode == 0 and result.stdout:
-                # Parse: default via 192.168.1.1 dev eth0
-                parts = result.stdout.split()
-                if len(parts) >= 3 and parts[0] == "default":
-                    gateway = parts[2]
-                    row = self._add_info_row(self.network_grid, row, "Gateway", gateway)
-        except Exception:
-            pass
+        if snapshot.gateway:
+            rows.append(("Gateway", snapshot.gateway, None))
+        if snapshot.dns_servers:
+            rows.append(("DNS", ", ".join(snapshot.dns_servers[:2]), None))
         
-        # DNS servers
-        try:
-            dns_servers = []
-            resolv_path = Path("/etc/resolv.conf")
-            if resolv_path.exists():
-                with open(resolv_path) as f:
-                    for line in f:
-                        if line.startswith("nameserver"):
-                            dns_servers.append(line.split()[1])
-            if dns_servers:
-                row = self._add_info_row(self.network_grid, row, "DNS", ", ".join(dns_servers[:2]))
-        except Exception:
-            pass
+        self._update_grid(self.network_grid, rows)
     
-    def load_enrollment_info(self):
+    def load_enrollment_info(self, snapshot: DeviceSnapshot):
         """Load enrollment status"""
-        self._clear_grid(self.enrollment_grid)
-        row = 0
+        rows: list[RowSpec] = []
         
-        status = self.validator.validate()
+        status = snapshot.status
         
         # aad-tool status (native check)
-        daemon_ok, daemon_msg = self.validator.check_aad_tool_status()
-        row = self._add_info_row(
-            self.enrollment_grid, row, "Daemon",
-            daemon_msg, status='success' if daemon_ok else 'error'
-        )
+        rows.append(("Daemon", snapshot.daemon_msg, 'success' if snapshot.daemon_ok else 'error'))
         
         # Domain
         if status.configured_domain:
-            row = self._add_info_row(
-                self.enrollment_grid, row, "Domain", 
-                status.configured_domain, status='success'
-            )
+            rows.append(("Domain", status.configured_domain, 'success'))
         else:
-            row = self._add_info_row(
-                self.enrollment_grid, row, "Domain", 
-                "Not configured", status='pending'
-            )
+            rows.append(("Domain", "Not configured", 'pending'))
         
         # Enrollment status
         if status.is_fully_configured:
-            row = self._add_info_row(
-                self.enrollment_grid, row, "Status", 
-                "Enrolled", status='success'
-            )
+            rows.append(("Status", "Enrolled", 'success'))
         elif status.himmelblau_installed:
-            row = self._add_info_row(
-                self.enrollment_grid, row, "Status", 
-                "Partially configured", status='warning'
-            )
+            rows.append(("Status", "Partially configured", 'warning'))
         else:
-            row = self._add_info_row(
-                self.enrollment_grid, row, "Status", 
-                "Not enrolled", status='pending'
-            )
+            rows.append(("Status", "Not enrolled", 'pending'))
         
         # Himmelblau version
         if status.himmelblau_version:
-            row = self._add_info_row(
-                self.enrollment_grid, row, "Agent Version", 
-                status.himmelblau_version
-            )
+            rows.append(("Agent Version", status.himmelblau_version, None))
         
         # Service status
         if status.himmelblaud_running:
-            row = self._add_info_row(
-                self.enrollment_grid, row, "Service", 
-                "Running", status='success'
-            )
+            rows.append(("Service", "Running", 'success'))
         else:
-            row = self._add_info_row(
-                self.enrollment_grid, row, "Service", 
-                "Stopped", status='error' if status.himmelblau_installed else 'pending'
-            )
+            rows.append((
+                "Service", "Stopped",
+                'error' if status.himmelblau_installed else 'pending'
+            ))
         
         # Config file
         if status.config_exists:
-            row = self._add_info_row(
-                self.enrollment_grid, row, "Configuration", 
-                "Present", status='success'
-            )
+            rows.append(("Configuration", "Present", 'success'))
         else:
-            row = self._add_info_row(
-                self.enrollment_grid, row, "Configuration", 
-                "Missing", status='pending'
-            )
+            rows.append(("Configuration", "Missing", 'pending'))
+        
+        self._update_grid(self.enrollment_grid, rows)
     
-    def load_compliance_info(self):
+    def load_compliance_info(self, snapshot: DeviceSnapshot):
         """Load compliance status"""
-        self._clear_grid(self.compliance_grid)
-        row = 0
+        rows: list[RowSpec] = []
         
-        status = self.validator.validate()
+        status = snapshot.status
         
         if not status.is_fully_configured:
-            row = self._add_info_row(
-                self.compliance_grid, row, "Status", 
-                "Not enrolled", status='pending'
-            )
-            row = self._add_info_row(
-                self.compliance_grid, row, "Policy", 
-                "N/A", status='pending'
-            )
+            rows.append(("Status", "Not enrolled", 'pending'))
+            rows.append(("Policy", "N/A", 'pending'))
+            self._update_grid(self.compliance_grid, rows)
             return
         
-        # Get Intune status from centralized validator
-        intune = self.validator.get_intune_status()
+        intune = snapshot.intune
         
         # Enrollment status
         enrollment_state_map = {
@@ -413,18 +738,15 @@ class DevicesView(QWidget):
             'failed': 'error',
             'unknown': 'pending',
         }
-        row = self._add_info_row(
-            self.compliance_grid, row, "Intune Status", 
+        rows.append((
+            "Intune Status",
             intune.display_enrollment,
-            status=enrollment_state_map.get(intune.enrollment_state, 'pending')
-        )
+            enrollment_state_map.get(intune.enrollment_state, 'pending')
+        ))
         
         # Show error detail if present
         if intune.enrollment_error:
-            row = self._add_info_row(
-                self.compliance_grid, row, "Error", 
-                intune.enrollment_error, status='error'
-            )
+            rows.append(("Error", intune.enrollment_error, 'error'))
         
         # Compliance status
         compliance_state_map = {
@@ -433,54 +755,27 @@ class DevicesView(QWidget):
             'unknown': 'warning',
             'not_applicable': 'pending',
         }
-        row = self._add_info_row(
-            self.compliance_grid, row, "Compliance",
+        rows.append((
+            "Compliance",
             intune.display_compliance,
-            status=compliance_state_map.get(intune.compliance_state, 'pending')
-        )
+            compliance_state_map.get(intune.compliance_state, 'pending')
+        ))
         
         # Policy enforcement
-        row = self._add_info_row(
-            self.compliance_grid, row, "Policy", 
+        rows.append((
+            "Policy",
             "Enabled" if status.config_exists else "Disabled",
-            status='success' if status.config_exists else 'pending'
-        )
+            'success' if status.config_exists else 'pending'
+        ))
         
         # Task scheduler (cronie)
         if status.cronie_running:
-            row = self._add_info_row(
-                self.compliance_grid, row, "Task Scheduler", 
-                "Running", status='success'
-            )
+            rows.append(("Task Scheduler", "Running", 'success'))
         else:
-            row = self._add_info_row(
-                self.compliance_grid, row, "Task Scheduler", 
-                "Not running", status='warning'
-            )
+            rows.append(("Task Scheduler", "Not running", 'warning'))
         
         # Last check-in (from journal)
-        try:
-            result = subprocess.run(
-                ["journalctl", "-u", "himmelblaud", "-n", "1", "--no-pager", 
-                 "-o", "short-iso", "--output-fields=__REALTIME_TIMESTAMP"],
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                # Get just the date part from the journal entry
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    if line and not line.startswith('--'):
-                        # Format: 2024-01-15T10:30:45+0000 hostname...
-                        parts = line.split()
-                        if parts:
-                            timestamp = parts[0]
-                            if 'T' in timestamp:
-                                date_part = timestamp.split('T')[0]
-                                time_part = timestamp.split('T')[1].split('+')[0].split('-')[0][:5]
-                                row = self._add_info_row(
-                                    self.compliance_grid, row, "Last Activity", 
-                                    f"{date_part} {time_part}"
-                                )
-                        break
-        except Exception:
-            pass
+        if snapshot.last_activity:
+            rows.append(("Last Activity", snapshot.last_activity, None))
+        
+        self._update_grid(self.compliance_grid, rows)
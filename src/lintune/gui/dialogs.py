@@ -4,11 +4,12 @@ Dialogs for LinTune
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QCheckBox, QProgressBar, QFrame, QTextEdit,
+    QPushButton, QCheckBox, QProgressBar, QFrame, QPlainTextEdit,
     QInputDialog, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer
 from PyQt6.QtGui import QFont
+from PyQt6 import sip
 
 from ..core.installer import Installer, InstallProgress, InstallStatus
 from ..utils.sudo_helper import get_sudo_helper
@@ -23,9 +24,11 @@ def get_sudo_password(parent=None) -> tuple[bool, str]:
     """
     sudo_helper = get_sudo_helper()
     
-    # If already validated, return cached password
+    # If already validated, return cached password while sudo still accepts it
     if sudo_helper.validated:
-        return (True, sudo_helper.password)
+        if sudo_helper.has_timestamp() or sudo_helper.refresh_sudo():
+            return (True, sudo_helper.password)
+        sudo_helper.clear()  # Password changed or revoked - ask again
     
     while True:
         password, ok = QInputDialog.getText(
@@ -71,17 +74,21 @@ def get_domain_info(parent=None) -> tuple[bool, str, bool]:
         QMessageBox.warning(parent, "Domain Required", "Please enter your EntraID domain.")
         return (False, "", False)
     
-    # Ask about sudo access
-    reply = QMessageBox.question(
-        parent,
-        "Grant Sudo Access",
-        f"Grant sudo access to EntraID users from {domain}?\n\n"
-        "This allows authenticated users to run administrative commands.",
-        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-        QMessageBox.StandardButton.Yes
-    )
-    
-    grant_sudo = (reply == QMessageBox.StandardButton.Yes)
+    # Ask about sudo access, once per domain and session
+    sudo_helper = get_sudo_helper()
+    grant_sudo = sudo_helper.grant_sudo_answers.get(domain.lower())
+    if grant_sudo is None:
+        reply = QMessageBox.question(
+            parent,
+            "Grant Sudo Access",
+            f"Grant sudo access to EntraID users from {domain}?\n\n"
+            "This allows authenticated users to run administrative commands.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.Yes
+        )
+        
+        grant_sudo = (reply == QMessageBox.StandardButton.Yes)
+        sudo_helper.grant_sudo_answers[domain.lower()] = grant_sudo
     
     return (True, domain, grant_sudo)
 
@@ -124,38 +131,110 @@ class DomainInputDialog:
 class InstallWorker(QThread):
     """Worker thread for installation"""
     
-    progress = pyqtSignal(object)  # InstallProgress
-    finished = pyqtSignal(bool)
+    # percent, message, step number, total steps, step name - primitives
+    # cross the thread boundary cheaper than a wrapped InstallProgress
+    progress = pyqtSignal(int, str, int, int, str)
+    # Emitted from run(); named apart from QThread.finished, which follows
+    # once the thread has actually stopped
+    install_finished = pyqtSignal(bool)
     
     def __init__(self, domain: str, grant_sudo: bool):
         super().__init__()
         self.domain = domain
         self.grant_sudo = grant_sudo
-        self.installer = None
+        # Created up front so cancel() can reach it before run() starts
+        self.installer = Installer(progress_callback=self.on_progress)
     
     def run(self):
-        self.installer = Installer(progress_callback=self.on_progress)
-        success = self.installer.install(self.domain, self.grant_sudo)
-        self.finished.emit(success)
+        success = False
+        try:
+            success = self.installer.install(self.domain, self.grant_sudo)
+        finally:
+            self.install_finished.emit(success)
     
     def on_progress(self, progress: InstallProgress):
-        self.progress.emit(progress)
+        self.progress.emit(
+            progress.progress_percent, progress.message,
+            progress.step_number, progress.total_steps, progress.current_step.value
+        )
 
 
 class InstallProgressDialog(QDialog):
     """Dialog showing installation progress"""
     
+    # Oldest log lines are dropped beyond this
+    MAX_LOG_LINES = 500
+    
+    # Progress updates are applied at most this often (~15 Hz)
+    PROGRESS_FLUSH_MS = 66
+    
+    _instance = None
+    
+    # Workers are kept here until they have finished, even after their
+    # dialog moved on or was replaced; a cancelled install only stops
+    # between steps and must not be destroyed while still running
+    _workers: set = set()
+    
     def __init__(self, domain: str, grant_sudo: bool, parent=None):
         super().__init__(parent)
         self.domain = domain
         self.grant_sudo = grant_sudo
         self.worker = None
+        
+        # Progress received since the last flush
+        self._pending_progress: tuple[int, str, int, int, str] | None = None
+        self._pending_log: list[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.PROGRESS_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_progress)
+        
         self.init_ui()
     
+    @classmethod
+    def get_instance(cls, domain: str, grant_sudo: bool, parent=None) -> "InstallProgressDialog":
+        """
+        Get a reset dialog for a new installation
+        
+        The dialog is built once and reused as long as its parent stays
+        the same, instead of rebuilding all widgets for every install.
+        It is parented to the top-level window: views like the dashboard
+        are recreated on every refresh and would defeat the cache.
+        """
+        if parent is not None:
+            parent = parent.window()
+        dialog = cls._instance
+        if dialog is None or sip.isdeleted(dialog) or dialog.parent() is not parent:
+            dialog = cls._instance = cls(domain, grant_sudo, parent)
+        else:
+            dialog.reset(domain, grant_sudo)
+        return dialog
+    
+    def reset(self, domain: str, grant_sudo: bool):
+        """Prepare the dialog for another installation"""
+        self.domain = domain
+        self.grant_sudo = grant_sudo
+        if self.worker is not None:
+            # A cancelled install may still report back - ignore it
+            self.worker.progress.disconnect(self.on_progress)
+            self.worker.install_finished.disconnect(self.on_finished)
+            self.worker = None
+        self._flush_timer.stop()
+        self._pending_progress = None
+        self._pending_log.clear()
+        
+        self.setWindowTitle("Installing...")
+        self.title_label.setText("Configuring device...")
+        self._set_title_state("")
+        self.progress_bar.setValue(0)
+        self.status_label.setText("Initializing...")
+        self.step_label.setText("Step 0/7")
+        self.log_output.clear()
+        self.close_btn.hide()
+    
     def init_ui(self):
         self.setWindowTitle("Installing...")
         self.setFixedSize(500, 350)
-        self.setStyleSheet("background-color: palette(window);")
         self.setModal(True)
         
         layout = QVBoxLayout(self)
@@ -164,120 +243,142 @@ class InstallProgressDialog(QDialog):
         
         # Title
         self.title_label = QLabel("Configuring device...")
-        self.title_label.setStyleSheet("font-size: 18px; font-weight: 600; ")
+        self.title_label.setObjectName("installTitle")
         layout.addWidget(self.title_label)
         
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                border-radius: 4px;
-                background-color: palette(mid);
-                height: 8px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 palette(highlight), stop:1 palette(dark));
-                border-radius: 4px;
-            }
-        """)
+        self.progress_bar.setObjectName("installProgressBar")
         layout.addWidget(self.progress_bar)
         
         # Status message
         self.status_label = QLabel("Initializing...")
-        self.status_label.setStyleSheet("font-size: 14px; ")
+        self.status_label.setObjectName("installStatus")
         layout.addWidget(self.status_label)
         
         # Step indicator
         self.step_label = QLabel("Step 0/7")
-        self.step_label.setStyleSheet("font-size: 12px; color: palette(mid);")
+        self.step_label.setObjectName("installStep")
         layout.addWidget(self.step_label)
         
         # Log output
-        self.log_output = QTextEdit()
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
         self.log_output.setMaximumHeight(120)
-        self.log_output.setStyleSheet("""
-            QTextEdit {
-                background-color: palette(midlight);
-                border: 1px solid palette(mid);
-                border-radius: 4px;
-                padding: 8px;
-                font-family: monospace;
-                font-size: 11px;
-            }
-        """)
+        self.log_output.setMaximumBlockCount(self.MAX_LOG_LINES)
+        self.log_output.setCenterOnScroll(False)
+        self.log_output.setObjectName("installLog")
         layout.addWidget(self.log_output)
         
         layout.addStretch()
         
         # Close button (hidden during install)
         self.close_btn = QPushButton("Close")
-        self.close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: palette(highlight);
-                color: palette(highlighted-text);
-                border: none;
-                border-radius: 4px;
-                padding: 8px 24px;
-                font-size: 14px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: palette(dark);
-            }
-        """)
+        self.close_btn.setObjectName("primaryButton")
         self.close_btn.clicked.connect(self.accept)
         self.close_btn.hide()
         layout.addWidget(self.close_btn, alignment=Qt.AlignmentFlag.AlignRight)
     
     def start_installation(self):
         """Start the installation process"""
-        self.worker = InstallWorker(self.domain, self.grant_sudo)
-        self.worker.progress.connect(self.on_progress)
-        self.worker.finished.connect(self.on_finished)
-        self.worker.start()
+        if any(worker.isRunning() for worker in self._workers):
+            # Two installers would fight over pacman and the config files
+            self.title_label.setText("✗ Installation Not Started")
+            self._set_title_state("failed")
+            self.status_label.setText("A cancelled installation is still finishing its current step")
+            self.log_output.appendPlainText("Wait for it to stop, then try again.")
+            self.close_btn.show()
+            return
+        
+        worker = self.worker = InstallWorker(self.domain, self.grant_sudo)
+        self._workers.add(worker)
+        worker.progress.connect(self.on_progress)
+        worker.install_finished.connect(self.on_finished)
+        worker.finished.connect(lambda: InstallProgressDialog._workers.discard(worker))
+        worker.start()
     
-    def on_progress(self, progress: InstallProgress):
-        """Update UI with progress"""
-        self.progress_bar.setValue(progress.progress_percent)
-        self.status_label.setText(progress.message)
-        self.step_label.setText(f"Step {progress.step_number}/{progress.total_steps}: {progress.current_step.value}")
+    def on_progress(self, percent: int, message: str, step_number: int,
+                    total_steps: int, step_name: str):
+        """Queue a progress update; bursts are applied together by _flush_progress"""
+        self._pending_progress = (percent, message, step_number, total_steps, step_name)
+        self._pending_log.append(f"[{percent:3d}%] {message}")
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_progress(self):
+        """Show the latest queued progress and all queued log lines"""
+        if self._pending_progress is None:
+            return
         
-        # Log message
-        self.log_output.append(f"[{progress.progress_percent:3d}%] {progress.message}")
+        percent, message, step_number, total_steps, step_name = self._pending_progress
+        self.progress_bar.setValue(percent)
+        self.status_label.setText(message)
+        self.step_label.setText(f"Step {step_number}/{total_steps}: {step_name}")
         
-        # Auto-scroll
-        scrollbar = self.log_output.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        # Log messages - QPlainTextEdit keeps following the end if the
+        # user hasn't scrolled up
+        self.log_output.appendPlainText("\n".join(self._pending_log))
+        
+        self._pending_progress = None
+        self._pending_log.clear()
     
     def on_finished(self, success: bool):
         """Handle installation completion"""
+        self._flush_timer.stop()
+        self._flush_progress()
+        
         if success:
             self.title_label.setText("✓ Installation Complete!")
-            self.title_label.setStyleSheet("font-size: 18px; font-weight: 600; color: palette(highlight);")
+            self._set_title_state("success")
             self.status_label.setText(f"Device configured for {self.domain}")
-            self.log_output.append("\n✓ Installation completed successfully!")
-            self.log_output.append("\nNext steps:")
-            self.log_output.append("  1. Log out of your current session")
-            self.log_output.append("  2. At login screen, click 'Not listed?'")
-            self.log_output.append(f"  3. Enter your email: user@{self.domain}")
-            self.log_output.append("  4. Complete MFA authentication")
+            # One append for the whole block - one layout pass
+            self.log_output.appendPlainText("\n".join([
+                "",
+                "✓ Installation completed successfully!",
+                "",
+                "Next steps:",
+                "  1. Log out of your current session",
+                "  2. At login screen, click 'Not listed?'",
+                f"  3. Enter your email: user@{self.domain}",
+                "  4. Complete MFA authentication",
+            ]))
         else:
             self.title_label.setText("✗ Installation Failed")
-            self.title_label.setStyleSheet("font-size: 18px; font-weight: 600; color: palette(link-visited);")
+            self._set_title_state("failed")
             self.status_label.setText("An error occurred during installation")
-            self.log_output.append("\n✗ Installation failed")
+            self.log_output.appendPlainText("\n✗ Installation failed")
         
         self.progress_bar.setValue(100 if success else self.progress_bar.value())
         self.close_btn.show()
     
+    def _set_title_state(self, state: str):
+        """Switch the title color via its [state] selector in fluent.qss"""
+        self.title_label.setProperty("state", state)
+        self.title_label.style().unpolish(self.title_label)
+        self.title_label.style().polish(self.title_label)
+    
     def showEvent(self, event):
         """Start installation when dialog is shown"""
         super().showEvent(event)
         self.start_installation()
+    
+    def _stop_worker(self):
+        """Cancel a running installation and give it a moment to stop"""
+        if self.worker is None or not self.worker.isRunning():
+            return
+        self.worker.installer.cancel()
+        self.worker.requestInterruption()
+        self.worker.wait(2000)
+    
+    def closeEvent(self, event):
+        """Don't leave the installation running behind a closed dialog"""
+        self._stop_worker()
+        super().closeEvent(event)
+    
+    def reject(self):
+        """Escape closes the dialog without a closeEvent"""
+        self._stop_worker()
+        super().reject()
 
@@ -4,32 +4,194 @@ Logs view for LinTune
 Shows system logs related to Himmelblau and enrollment.
 """
 
+import os
+import re
 import subprocess
+import threading
+import time
+from collections import deque
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QComboBox, QFrame, QLineEdit
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QTextEdit, QComboBox, QFrame, QLineEdit, QCheckBox
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont, QTextCursor
+from PyQt6.QtCore import Qt, QEvent, QTimer, QThread, pyqtSignal
+from PyQt6.QtGui import QFont, QTextCharFormat, QTextCursor
 
 from .widgets import RefreshButton
 
 
+# Keywords that color a log line, most severe first
+_LEVEL_RE = re.compile(r'error|fail|warn|info|success|ok', re.I)
+_LEVEL_PRIORITY = {'error': 0, 'fail': 0, 'warn': 1, 'info': 2, 'success': 3, 'ok': 3}
+
+# Plain, locale independent journalctl output
+_JOURNAL_ENV = {**os.environ, "SYSTEMD_COLORS": "0", "LC_ALL": "C"}
+
+# Identical journal queries closer together than this are skipped
+RELOAD_MIN_INTERVAL = 1.0
+
+# Typing pause before the search filter is applied (ms)
+FILTER_DEBOUNCE_MS = 150
+
+CURSOR_PREFIX = "-- cursor: "
+
+# journalctl output is passed to the view in batches of this many lines
+CHUNK_LINES = 50
+JOURNAL_TIMEOUT = 10.0
+
+
+class JournalWorker(QThread):
+    """Worker thread streaming a unit's journal"""
+    
+    chunk = pyqtSignal(object)   # Batch of log lines, in journal order
+    loaded = pyqtSignal(str)     # Journal cursor ("" if no entries), after the last chunk
+    failed = pyqtSignal(str)     # Error message
+    
+    def __init__(self, service: str, argv: list[str], incremental: bool = False):
+        super().__init__()
+        self.service = service
+        self.argv = argv
+        self.incremental = incremental
+        self._timed_out = False
+        self._proc = None
+    
+    def run(self):
+        try:
+            proc = subprocess.Popen(
+                self.argv,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                errors='replace',  # Journal messages aren't guaranteed to be UTF-8
+                bufsize=1,
+                env=_JOURNAL_ENV
+            )
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self._proc = proc
+        if self.isInterruptionRequested():
+            proc.terminate()  # stop() came before there was a process to end
+        
+        # No event loop runs in this thread, so the watchdog is a plain timer thread
+        watchdog = threading.Timer(JOURNAL_TIMEOUT, self._expire, (proc,))
+        watchdog.start()
+        try:
+            batch = []
+            last = None  # Held back - it may be the cursor line
+            for line in proc.stdout:
+                if last is not None:
+                    batch.append(last)
+                    if len(batch) >= CHUNK_LINES:
+                        self.chunk.emit(batch)
+                        batch = []  # The emitted list now belongs to the receiver
+                last = line.rstrip('\n')
+            proc.wait()
+        except Exception as e:
+            proc.kill()
+            proc.wait()
+            self.failed.emit(str(e))
+            return
+        finally:
+            watchdog.cancel()
+            proc.stdout.close()
+        
+        if self._timed_out:
+            self.failed.emit("Timeout")
+            return
+        
+        # --show-cursor prints the cursor of the last entry as the final line
+        cursor = ""
+        if last is not None:
+            if last.startswith(CURSOR_PREFIX):
+                cursor = last[len(CURSOR_PREFIX):]
+            else:
+                batch.append(last)
+        if batch:
+            self.chunk.emit(batch)
+        self.loaded.emit(cursor)
+    
+    def _expire(self, proc: subprocess.Popen):
+        """Stop a journalctl that is taking too long"""
+        self._timed_out = True
+        proc.terminate()
+    
+    def stop(self):
+        """Make run() return soon by terminating journalctl"""
+        self.requestInterruption()
+        if self._proc is not None:
+            self._proc.terminate()
+
+
+def _installed_units() -> set[str] | None:
+    """Names of the unit files systemd knows about, None if it can't be asked"""
+    try:
+        result = subprocess.run(
+            ["systemctl", "list-unit-files", "--no-legend", "--no-pager"],
+            capture_output=True,
+            text=True,
+            timeout=2,
+            env=_JOURNAL_ENV
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return {line.split(None, 1)[0] for line in result.stdout.splitlines() if line.strip()}
+
+
+class UnitCheckWorker(QThread):
+    """Worker thread listing the installed unit files"""
+    
+    checked = pyqtSignal(object)  # set of unit file names, None if systemd can't be asked
+    
+    def run(self):
+        self.checked.emit(_installed_units())
+
+
 class LogsView(QWidget):
     """Logs viewer with filtering and auto-refresh"""
     
-    LOG_SOURCES = {
-        "Himmelblau Daemon": "himmelblaud",
-        "Himmelblau Tasks": "himmelblaud-tasks",
-        "GDM": "gdm",
-        "System Auth": "system-auth",
-    }
+    # (display name, systemd unit), in source combo order
+    LOG_SOURCES = [
+        ("Himmelblau Daemon", "himmelblaud"),
+        ("Himmelblau Tasks", "himmelblaud-tasks"),
+        ("GDM", "gdm"),
+        ("System Auth", "system-auth"),
+    ]
     
     def __init__(self):
         super().__init__()
         self.auto_refresh = False
+        self._worker = None
+        self._reload_pending = False
+        self._last_load = 0.0
+        # Query the loaded lines belong to, and where the journal was read up to
+        self._log_key = None
+        self._cursor = None
+        self._streaming = False  # Current load has delivered lines already
+        self._trimmed = False    # Incremental load pushed old lines out
+        self._log_lines = deque()
+        self._lines_lower = deque()  # Lowercased _log_lines for searching
+        self.full_log_content = ""
+        self._level_formats = None  # Built from the palette on first render
+        
+        # Coalesce search keystrokes into one filter pass
+        self._pending_filter = ""
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_pending_filter)
+        
+        # Sources whose unit isn't installed are shown disabled and never
+        # queried; rechecked whenever the view is shown or refreshed, since
+        # LinTune itself installs the Himmelblau services
+        self._available = [True] * len(self.LOG_SOURCES)
+        self._unit_worker = None
+        
         self.refresh_timer = QTimer()
         self.refresh_timer.timeout.connect(self.load_logs)
+        QApplication.instance().aboutToQuit.connect(self._stop_workers)
         self.init_ui()
         self.load_logs()
     
@@ -42,7 +204,7 @@ class LogsView(QWidget):
         header_layout = QHBoxLayout()
         
         title = QLabel("Logs")
-        title.setStyleSheet("font-size: 24px; font-weight: 600; ")
+        title.setObjectName("viewTitle")
         header_layout.addWidget(title)
         
         header_layout.addStretch()
@@ -50,20 +212,7 @@ class LogsView(QWidget):
         # Auto-refresh toggle
         self.auto_refresh_btn = QPushButton("Auto-refresh: Off")
         self.auto_refresh_btn.setCheckable(True)
-        self.auto_refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: 1px solid palette(mid);
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 12px;
-            }
-            QPushButton:checked {
-                background-color: palette(highlight);
-                color: palette(highlighted-text);
-                border: none;
-            }
-        """)
+        self.auto_refresh_btn.setObjectName("toggleButton")
         self.auto_refresh_btn.clicked.connect(self.toggle_auto_refresh)
         header_layout.addWidget(self.auto_refresh_btn)
         
@@ -76,33 +225,18 @@ class LogsView(QWidget):
         
         # Filter bar
         filter_frame = QFrame()
-        filter_frame.setStyleSheet("""
-            QFrame {
-                background-color: palette(base);
-                border: 1px solid palette(mid);
-                border-radius: 4px;
-                padding: 8px;
-            }
-        """)
+        filter_frame.setObjectName("logFilterBar")
         filter_layout = QHBoxLayout(filter_frame)
         filter_layout.setContentsMargins(12, 8, 12, 8)
         
         # Source selector
         source_label = QLabel("Source:")
-        source_label.setStyleSheet(" font-size: 13px;")
+        source_label.setObjectName("filterLabel")
         filter_layout.addWidget(source_label)
         
         self.source_combo = QComboBox()
-        self.source_combo.addItems(list(self.LOG_SOURCES.keys()))
-        self.source_combo.setStyleSheet("""
-            QComboBox {
-                background-color: palette(base);
-                border: 1px solid palette(mid);
-                border-radius: 4px;
-                padding: 6px 12px;
-                min-width: 150px;
-            }
-        """)
+        self.source_combo.addItems([name for name, _ in self.LOG_SOURCES])
+        self.source_combo.setObjectName("sourceCombo")
         self.source_combo.currentIndexChanged.connect(self.load_logs)
         filter_layout.addWidget(self.source_combo)
         
@@ -110,41 +244,33 @@ class LogsView(QWidget):
         
         # Lines selector
         lines_label = QLabel("Lines:")
-        lines_label.setStyleSheet(" font-size: 13px;")
+        lines_label.setObjectName("filterLabel")
         filter_layout.addWidget(lines_label)
         
         self.lines_combo = QComboBox()
         self.lines_combo.addItems(["50", "100", "200", "500"])
         self.lines_combo.setCurrentText("100")
-        self.lines_combo.setStyleSheet("""
-            QComboBox {
-                background-color: palette(base);
-                border: 1px solid palette(mid);
-                border-radius: 4px;
-                padding: 6px 12px;
-                min-width: 80px;
-            }
-        """)
+        self.lines_combo.setObjectName("linesCombo")
         self.lines_combo.currentIndexChanged.connect(self.load_logs)
         filter_layout.addWidget(self.lines_combo)
         
         filter_layout.addSpacing(16)
         
+        # Compact output - message text only, no timestamps
+        self.compact_check = QCheckBox("Compact")
+        self.compact_check.setObjectName("filterLabel")
+        self.compact_check.toggled.connect(self.load_logs)
+        filter_layout.addWidget(self.compact_check)
+        
+        filter_layout.addSpacing(16)
+        
         # Search
         search_label = QLabel("🔍")
         filter_layout.addWidget(search_label)
         
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Filter logs...")
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                background-color: palette(base);
-                border: 1px solid palette(mid);
-                border-radius: 4px;
-                padding: 6px 12px;
-                min-width: 200px;
-            }
-        """)
+        self.search_input.setObjectName("logSearch")
         self.search_input.textChanged.connect(self.filter_logs)
         filter_layout.addWidget(self.search_input)
         
@@ -152,16 +278,7 @@ class LogsView(QWidget):
         
         # Clear button
         clear_btn = QPushButton("Clear")
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: 1px solid palette(mid);
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 12px;
-            }
-            QPushButton:hover { background-color: palette(midlight); }
-        """)
+        clear_btn.setObjectName("outlineButton")
         clear_btn.clicked.connect(self.clear_logs)
         filter_layout.addWidget(clear_btn)
         
@@ -171,95 +288,257 @@ class LogsView(QWidget):
         self.log_output = QTextEdit()
         self.log_output.setReadOnly(True)
         self.log_output.setFont(QFont("Monospace", 10))
-        self.log_output.setStyleSheet("""
-            QTextEdit {
-                background-color: palette(base);
-                color: palette(text);
-                border: 1px solid palette(mid);
-                border-radius: 4px;
-                padding: 12px;
-                font-family: "Cascadia Code", "Fira Code", monospace;
-                font-size: 12px;
-            }
-        """)
+        self.log_output.setObjectName("logOutput")
         layout.addWidget(self.log_output, 1)
         
         # Status bar
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet(" font-size: 12px;")
+        self.status_label.setObjectName("logStatus")
         layout.addWidget(self.status_label)
     
     def on_refresh_clicked(self):
         """Handle refresh button click with visual feedback"""
         self.refresh_btn.start_refresh()
+        self._check_units()
         self.load_logs()
-        self.refresh_btn.finish_refresh()
+    
+    def _check_units(self):
+        """Find out in the background which sources' units are installed"""
+        if self._unit_worker is not None and self._unit_worker.isRunning():
+            return
+        self._unit_worker = UnitCheckWorker()
+        self._unit_worker.checked.connect(self._on_units_checked)
+        self._unit_worker.start()
+    
+    def _on_units_checked(self, units: set[str] | None):
+        """Enable the sources whose unit is installed, disable the rest"""
+        available = [
+            units is None or f"{unit}.service" in units for _, unit in self.LOG_SOURCES
+        ]
+        if available == self._available:
+            return
+        
+        index = self.source_combo.currentIndex()
+        current_changed = available[index] != self._available[index]
+        self._available = available
+        
+        model = self.source_combo.model()
+        for row, is_available in enumerate(available):
+            item = model.item(row)
+            item.setEnabled(is_available)
+            item.setToolTip("" if is_available else "Service not installed")
+        
+        if current_changed:
+            self._log_key = None  # Start over with a full load
+            self.load_logs()
     
     def load_logs(self):
-        """Load logs from journalctl"""
-        source_name = self.source_combo.currentText()
-        service = self.LOG_SOURCES.get(source_name, "himmelblaud")
-        lines = self.lines_combo.currentText()
+        """Load logs from journalctl in a background thread"""
+        if self._worker is not None and self._worker.isRunning():
+            # Source or line count may have changed - reload once it is done
+            self._reload_pending = True
+            return
         
-        try:
-            result = subprocess.run(
-                ["journalctl", "-u", f"{service}.service", "-n", lines, "--no-pager"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            self.full_log_content = result.stdout
-            self.display_logs(self.full_log_content)
-            self.status_label.setText(f"Loaded {len(self.full_log_content.splitlines())} lines from {service}")
-            
-        except subprocess.TimeoutExpired:
-            self.log_output.setText("Timeout loading logs")
-            self.status_label.setText("Error: Timeout")
-        except Exception as e:
-            self.log_output.setText(f"Error loading logs: {e}")
-            self.status_label.setText(f"Error: {e}")
+        index = self.source_combo.currentIndex()
+        service = self.LOG_SOURCES[index][1]
+        if not self._available[index]:
+            self._log_key = None
+            self.log_output.clear()
+            self.status_label.setText("Service not installed")
+            if self.refresh_btn.is_refreshing:
+                self.refresh_btn.finish_refresh()
+            return
+        
+        lines = int(self.lines_combo.currentText())
+        output = "cat" if self.compact_check.isChecked() else "short-iso"
+        key = (service, lines, output)
+        
+        # Same query as a moment ago - the result would be the same
+        now = time.monotonic()
+        if key == self._log_key and now - self._last_load < RELOAD_MIN_INTERVAL:
+            if self.refresh_btn.is_refreshing:
+                self.refresh_btn.finish_refresh()
+            return
+        self._last_load = now
+        
+        argv = ["journalctl", "-u", f"{service}.service", "-n", str(lines),
+                "--no-pager", "--no-hostname", "-q", "-o", output, "--show-cursor"]
+        
+        # Same query as last time - only fetch entries added since then
+        incremental = key == self._log_key and self._cursor is not None
+        if incremental:
+            argv.append(f"--after-cursor={self._cursor}")
+        else:
+            self._log_key = key
+            self._cursor = None
+        
+        self._streaming = False
+        self._trimmed = False
+        self._worker = JournalWorker(service, argv, incremental)
+        self._worker.chunk.connect(self._on_logs_chunk)
+        self._worker.loaded.connect(self._on_logs_loaded)
+        self._worker.failed.connect(self._on_logs_failed)
+        self._worker.finished.connect(self._on_worker_finished)
+        self._worker.start()
+    
+    def _start_full_load(self):
+        """Drop the previous lines before a full load delivers its first ones"""
+        max_lines = self._log_key[1]
+        self._log_lines = deque(maxlen=max_lines)
+        self._lines_lower = deque(maxlen=max_lines)
+        self.log_output.clear()
+        self._streaming = True
+    
+    def _on_logs_chunk(self, lines: list[str]):
+        """Show a batch of journal lines as soon as it arrives"""
+        if self.sender() is not self._worker:
+            return  # Queued from a load that has since been replaced
+        if not self._streaming and not self._worker.incremental:
+            self._start_full_load()
+        self._streaming = True
+        
+        if len(self._log_lines) + len(lines) > self._log_lines.maxlen:
+            self._trimmed = True
+        self._log_lines.extend(lines)
+        lower = [line.lower() for line in lines]
+        self._lines_lower.extend(lower)
+        
+        # Old lines that dropped out are removed from the display once loading is done
+        needle = self.search_input.text().lower()
+        if needle:
+            lines = [line for line, line_lower in zip(lines, lower) if needle in line_lower]
+        if lines:
+            self._append_lines(lines)
+    
+    def _on_logs_loaded(self, cursor: str):
+        """Finish a journal load once all lines have arrived"""
+        if self.sender() is not self._worker:
+            return
+        if cursor:
+            self._cursor = cursor
+        
+        if not self._streaming:
+            if self._worker.incremental:
+                return  # Nothing new since the last refresh
+            self._start_full_load()  # Unit has no entries
+        
+        self.full_log_content = '\n'.join(self._log_lines)
+        if self._trimmed:
+            self._apply_filter(self.search_input.text())
+        
+        self.status_label.setText(
+            f"Loaded {len(self._log_lines)} lines from {self._worker.service}"
+        )
+    
+    def _on_logs_failed(self, error: str):
+        """Show a journal loading error"""
+        if self.sender() is not self._worker:
+            return
+        self._log_key = None  # Start over with a full load next time
+        self.log_output.setText(f"Error loading logs: {error}")
+        self.status_label.setText(f"Error: {error}")
+    
+    def _on_worker_finished(self):
+        """Re-enable refreshing once the worker thread is done"""
+        if self.refresh_btn.is_refreshing:
+            self.refresh_btn.finish_refresh()
+        if self._reload_pending:
+            self._reload_pending = False
+            self.load_logs()
+    
+    def _stop_workers(self):
+        """Let the journal and unit check threads finish before the application exits"""
+        self.refresh_timer.stop()
+        if self._worker is not None:
+            self._worker.stop()
+            self._worker.wait()
+        if self._unit_worker is not None:
+            self._unit_worker.wait()  # systemctl is bounded by its own timeout
     
     def display_logs(self, content: str):
         """Display logs with syntax highlighting using palette colors"""
         self.log_output.clear()
-        
-        # Get colors from palette for theme compatibility
-        palette = self.palette()
-        error_color = palette.linkVisited().color().name()  # Typically reddish
-        warn_color = palette.brightText().color().name()    # Bright/attention
-        info_color = palette.highlight().color().name()     # Accent color
-        success_color = palette.highlight().color().name()  # Accent color
-        
-        for line in content.split('\n'):
-            if 'error' in line.lower() or 'fail' in line.lower():
-                self.log_output.append(f'<span style="color: {error_color};">{line}</span>')
-            elif 'warn' in line.lower():
-                self.log_output.append(f'<span style="color: {warn_color};">{line}</span>')
-            elif 'info' in line.lower():
-                self.log_output.append(f'<span style="color: {info_color};">{line}</span>')
-            elif 'success' in line.lower() or 'ok' in line.lower():
-                self.log_output.append(f'<span style="color: {success_color};">{line}</span>')
-            else:
-                self.log_output.append(line)
+        self._insert_lines(content.split('\n'))
         
         # Scroll to bottom
         cursor = self.log_output.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
         self.log_output.setTextCursor(cursor)
     
-    def filter_logs(self, text: str):
-        """Filter displayed logs"""
-        if not hasattr(self, 'full_log_content'):
-            return
+    def _append_lines(self, lines: list[str]):
+        """Add lines below the current output, following them if scrolled to the end"""
+        scrollbar = self.log_output.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        self._insert_lines(lines)
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+    
+    def _ensure_level_formats(self) -> list[QTextCharFormat]:
+        """Character formats per keyword priority, built from the palette once"""
+        if self._level_formats is None:
+            # Get colors from palette for theme compatibility
+            palette = self.palette()
+            self._level_formats = []
+            for color in (
+                palette.linkVisited().color(),  # Error - typically reddish
+                palette.brightText().color(),   # Warning - bright/attention
+                palette.highlight().color(),    # Info - accent color
+                palette.highlight().color(),    # Success - accent color
+            ):
+                fmt = QTextCharFormat()
+                fmt.setForeground(color)
+                self._level_formats.append(fmt)
+        return self._level_formats
+    
+    def changeEvent(self, event):
+        """Pick up new log colors when the theme changes"""
+        if event.type() == QEvent.Type.PaletteChange:
+            self._level_formats = None
+        super().changeEvent(event)
+    
+    def _insert_lines(self, lines: list[str]):
+        """Insert log lines as plain text at the end, colored by keyword"""
+        formats = self._ensure_level_formats()
+        plain = QTextCharFormat()
+        
+        document = self.log_output.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        separator = "\n" if not document.isEmpty() else ""
         
+        self.log_output.setUpdatesEnabled(False)
+        cursor.beginEditBlock()
+        try:
+            for line in lines:
+                matches = _LEVEL_RE.findall(line)
+                if matches:
+                    fmt = formats[min(_LEVEL_PRIORITY[m.lower()] for m in matches)]
+                else:
+                    fmt = plain
+                cursor.insertText(separator + line, fmt)
+                separator = "\n"
+        finally:
+            cursor.endEditBlock()
+            self.log_output.setUpdatesEnabled(True)
+    
+    def filter_logs(self, text: str):
+        """Filter displayed logs once typing pauses"""
+        self._pending_filter = text
+        self._filter_timer.start()  # Restarts on every keystroke
+    
+    def _apply_pending_filter(self):
+        self._apply_filter(self._pending_filter)
+    
+    def _apply_filter(self, text: str):
+        """Display the loaded lines containing text (case-insensitive)"""
         if not text:
             self.display_logs(self.full_log_content)
             return
         
+        needle = text.lower()
         filtered = '\n'.join(
-            line for line in self.full_log_content.split('\n')
-            if text.lower() in line.lower()
+            line for line, line_lower in zip(self._log_lines, self._lines_lower)
+            if needle in line_lower
         )
         self.display_logs(filtered)
     
@@ -268,6 +547,19 @@ class LogsView(QWidget):
         self.log_output.clear()
         self.status_label.setText("Cleared")
     
+    def hideEvent(self, event):
+        """Don't poll the journal while the view isn't visible"""
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+    
+    def showEvent(self, event):
+        """Resume auto-refresh when the view becomes visible again"""
+        super().showEvent(event)
+        self._check_units()
+        if self.auto_refresh and not self.refresh_timer.isActive():
+            self.refresh_timer.start(5000)
+            self.load_logs()
+    
     def toggle_auto_refresh(self, checked: bool):
         """Toggle auto-refresh"""
         self.auto_refresh = checked
@@ -4,8 +4,11 @@ Main application window for LinTune
 Microsoft Intune Portal-inspired interface with sidebar navigation
 """
 
+import functools
+from pathlib import Path
+
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QStackedWidget, QStatusBar, QLabel
 )
 from PyQt6.QtCore import Qt, pyqtSignal
@@ -21,6 +24,15 @@ from ..core.validator import SystemValidator
 from .. import __version__
 
 
+STYLESHEET_PATH = Path(__file__).parent.parent / 'resources' / 'styles' / 'fluent.qss'
+
+
+@functools.lru_cache(maxsize=1)
+def _load_qss() -> str:
+    """Read the application stylesheet (once per process)"""
+    return STYLESHEET_PATH.read_text()
+
+
 class MainWindow(QMainWindow):
     """Main application window"""
     
@@ -81,18 +93,18 @@ class MainWindow(QMainWindow):
         # Add views to stack
         self.content_stack.addWidget(self.dashboard_view)
         
-        # Devices view
-        self.devices_view = DevicesView()
-        self.content_stack.addWidget(self.devices_view)
-        
-        # Settings view
-        self.settings_view = SettingsView()
-        self.settings_view.config_changed.connect(self.refresh_status)
-        self.content_stack.addWidget(self.settings_view)
-        
-        # Logs view
-        self.logs_view = LogsView()
-        self.content_stack.addWidget(self.logs_view)
+        # Devices, Settings and Logs views are built on first visit, so their
+        # initial system queries don't delay the first paint of the window
+        self.devices_view = None
+        self.settings_view = None
+        self.logs_view = None
+        self._lazy_views = {
+            1: self._create_devices_view,
+            2: self._create_settings_view,
+            3: self._create_logs_view,
+        }
+        for _ in self._lazy_views:
+            self.content_stack.addWidget(QWidget())  # Placeholder
         
         # About view
         about_widget = QWidget()
@@ -140,18 +152,42 @@ class MainWindow(QMainWindow):
     def load_stylesheet(self):
         """Load minimal stylesheet (relies on system theme)"""
         try:
-            from pathlib import Path
-            
-            current_dir = Path(__file__).parent
-            stylesheet_path = current_dir.parent / 'resources' / 'styles' / 'fluent.qss'
-            
-            with open(stylesheet_path, 'r') as f:
-                self.setStyleSheet(f.read())
+            # Application wide, so dialogs share the parsed sheet
+            app = QApplication.instance()
+            qss = _load_qss()
+            if app.styleSheet() != qss:
+                app.setStyleSheet(qss)
         except Exception as e:
             print(f"Warning: Could not load stylesheet: {e}")
     
+    def _create_devices_view(self) -> QWidget:
+        self.devices_view = DevicesView()
+        return self.devices_view
+    
+    def _create_settings_view(self) -> QWidget:
+        self.settings_view = SettingsView()
+        self.settings_view.config_changed.connect(self.refresh_status)
+        return self.settings_view
+    
+    def _create_logs_view(self) -> QWidget:
+        self.logs_view = LogsView()
+        return self.logs_view
+    
+    def _ensure_view(self, index: int):
+        """Replace the placeholder at index with its real view, if not done yet"""
+        factory = self._lazy_views.pop(index, None)
+        if factory is None:
+            return
+        
+        placeholder = self.content_stack.widget(index)
+        view = factory()
+        self.content_stack.removeWidget(placeholder)
+        self.content_stack.insertWidget(index, view)
+        placeholder.deleteLater()
+    
     def on_navigation_changed(self, index: int):
         """Handle navigation changes from sidebar"""
+        self._ensure_view(index)
         self.content_stack.setCurrentIndex(index)
         
         # Update status based on view
@@ -202,6 +238,8 @@ class MainWindow(QMainWindow):
             except:
                 pass  # Signals might not be connected
             
+            # Drop its wait cursor - the new dashboard's button never pushed one
+            old_dashboard.refresh_btn.finish_refresh()
             self.content_stack.removeWidget(old_dashboard)
             old_dashboard.deleteLater()
         
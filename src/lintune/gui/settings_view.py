@@ -2,60 +2,342 @@
 Settings view for LinTune - Compact layout, no scrolling
 """
 
+import os
+import re
+import signal
 import subprocess
+import threading
+import time
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QLineEdit, QCheckBox, QMessageBox, QGridLayout,
-    QProgressDialog, QApplication
+    QProgressDialog, QApplication, QStackedWidget, QToolButton
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, QObject
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QObject, QRunnable, QThreadPool
 
 from .widgets import StatusBadge
-from ..utils.sudo_helper import run_with_sudo
+from ..utils.sudo_helper import get_sudo_helper, run_with_sudo, run_batch_with_sudo
 
 
-class AadToolWorker(QObject):
-    """Worker for running aad-tool commands in background thread"""
+CONFIG_PATH = Path("/etc/himmelblau/himmelblau.conf")
+
+# Atomically replaces $2 with a copy of $1 in one privileged call
+_REPLACE_CONFIG_SH = 'install -m 644 "$1" "$2.tmp" && sync "$2.tmp" && mv -f "$2.tmp" "$2"'
+
+# Settings shown in the view; comment lines never match
+_CONF_RE = re.compile(r'^[ \t]*(domains|local_groups|debug|apply_policy)[ \t]*=[ \t]*(.*?)[ \t]*$', re.M)
+
+# Service and backup status newer than this is not checked again (seconds)
+STATUS_CACHE_TTL = 2.0
+
+# Configs backed up during enrollment, by badge label
+BACKUP_FILES = (
+    ("NSS", Path("/etc/nsswitch.conf.backup")),
+    ("PAM", Path("/etc/pam.d/system-auth.backup")),
+)
+
+
+# (monotonic time checked, labels found) of the last backup check
+_backup_cache = None
+
+
+def _backup_state() -> tuple[str, ...]:
+    """Labels of the configs that have an enrollment backup, rechecked at most every STATUS_CACHE_TTL"""
+    global _backup_cache
+    now = time.monotonic()
+    if _backup_cache is None or now - _backup_cache[0] >= STATUS_CACHE_TTL:
+        _backup_cache = (now, tuple(name for name, path in BACKUP_FILES if os.path.exists(path)))
+    return _backup_cache[1]
+
+
+# Extra seconds the local side waits for a privileged command's own timeout
+PRIVILEGED_TIMEOUT_GRACE = 2
+# Exit status of `timeout -s KILL` when it had to kill the command
+_KILLED_BY_TIMEOUT = 128 + signal.SIGKILL
+
+
+def _run_in_session(argv: list[str], timeout: float = 5, input: bytes | None = None) -> subprocess.CompletedProcess:
+    """
+    Run a command in its own session, killing its whole process group on timeout
+    
+    Args:
+        argv: Command to run
+        timeout: Seconds before the command and everything it started is killed
+        input: Bytes for stdin (stdin is /dev/null otherwise)
+        
+    Returns:
+        CompletedProcess instance (output captured as text)
+    """
+    proc = subprocess.Popen(
+        argv,
+        stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True
+    )
+    try:
+        # Raw bytes in and out, decoded once below
+        stdout, stderr = proc.communicate(input, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            try:
+                proc.kill()  # Group gone, or a privileged child we may not signal
+            except PermissionError:
+                # Root-owned - its own `timeout` ends it; don't block until then,
+                # but reap it once it exits so it doesn't linger as a zombie
+                proc.stdout.close()
+                proc.stderr.close()
+                threading.Thread(target=proc.wait, daemon=True).start()
+                raise subprocess.TimeoutExpired(argv, timeout) from None
+        proc.communicate()
+        raise
+    return subprocess.CompletedProcess(
+        argv, proc.returncode,
+        stdout.decode('utf-8', 'replace'), stderr.decode('utf-8', 'replace')
+    )
+
+
+def run_privileged(cmd: list[str], timeout: float = 5) -> subprocess.CompletedProcess:
+    """
+    Run a command as root, reusing the session's sudo credentials
+    
+    Once the sudo password has been entered, commands go through the cached
+    sudo session instead of asking PolicyKit to authenticate every time.
+    
+    The timeout is enforced on the root side with timeout(1), since a
+    root-owned process can't be killed from here.
+    
+    Args:
+        cmd: Command to run (without sudo/pkexec prefix)
+        timeout: Seconds before the command is killed
+        
+    Returns:
+        CompletedProcess instance (output captured as text)
+    """
+    sudo_helper = get_sudo_helper()
+    limited = ['timeout', '-s', 'KILL', str(timeout)] + cmd
+    # The local timeout is only a backstop behind the root-side one
+    local_timeout = timeout + PRIVILEGED_TIMEOUT_GRACE
+    if sudo_helper.validated:
+        result = _run_in_session(['sudo', '-S'] + limited, local_timeout, input=sudo_helper.password_input())
+    else:
+        result = _run_in_session(['pkexec'] + limited, local_timeout)
+    if result.returncode == _KILLED_BY_TIMEOUT:
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return result
+
+
+class CommandSignals(QObject):
+    """Signals of a CommandRunnable or TaskRunnable (QRunnable can't define its own)"""
     
     finished = pyqtSignal(bool, str)  # success, message
+    progress = pyqtSignal(int, str)  # step, label
+
+
+class CommandRunnable(QRunnable):
+    """Runs a command on a QThreadPool thread"""
     
-    def __init__(self, command: str, args: list = None):
+    def __init__(self, argv: list[str], timeout: float = 5, privileged: bool = False):
         super().__init__()
-        self.command = command
-        self.args = args or []
+        self.argv = argv
+        self.timeout = timeout
+        self.privileged = privileged
+        self.signals = CommandSignals()
     
     def run(self):
-        """Execute the aad-tool command"""
+        """Execute the command"""
+        name = ' '.join(self.argv[:2])
         try:
-            cmd = ['pkexec', 'aad-tool', self.command] + self.args
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+            if self.privileged:
+                result = run_privileged(self.argv, self.timeout)
+            else:
+                result = _run_in_session(self.argv, self.timeout)
             
             output = result.stdout.strip()
             if result.returncode == 0:
-                self.finished.emit(True, output or f"{self.command} completed")
+                self.signals.finished.emit(True, output or f"{name} completed")
             else:
                 error = result.stderr.strip()
-                self.finished.emit(False, error or output or f"{self.command} failed")
+                self.signals.finished.emit(False, error or output or f"{name} failed")
         except subprocess.TimeoutExpired:
-            self.finished.emit(False, "Operation timed out")
+            self.signals.finished.emit(False, "Operation timed out")
+        except FileNotFoundError:
+            self.signals.finished.emit(False, f"{os.path.basename(self.argv[0])} not found")
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
+
+
+class TaskRunnable(QRunnable):
+    """Runs a function returning (success, message) on a QThreadPool thread"""
+    
+    def __init__(self, func):
+        super().__init__()
+        self.func = func
+        self.signals = CommandSignals()
+    
+    def run(self):
+        """Call the function, passing it a callback(step, label) for progress"""
+        try:
+            success, message = self.func(self.signals.progress.emit)
         except Exception as e:
-            self.finished.emit(False, str(e))
+            success, message = False, str(e)
+        self.signals.finished.emit(success, message)
+
+
+class StatusWorker(QObject):
+    """Worker checking service and backup status in a background thread"""
+    
+    finished = pyqtSignal(object, object)  # service running (None if unknown), backups found (None if not checked)
+    
+    def run(self, check_backups: bool):
+        """Check whether himmelblaud runs and, if asked, which configs are backed up"""
+        try:
+            r = _run_in_session(["systemctl", "is-active", "himmelblaud"])
+            running = r.returncode == 0
+        except (OSError, subprocess.SubprocessError):
+            running = None
+        
+        backups = None
+        if check_backups:
+            backups = list(_backup_state())
+        self.finished.emit(running, backups)
+
+
+def _stop_and_disable_services(report, first_step: int):
+    """Stop and disable the Himmelblau services, ignoring ones that don't exist"""
+    report(first_step, "Stopping Himmelblau services...")
+    try:
+        run_batch_with_sudo([
+            ["systemctl", "stop", "himmelblaud"],
+            ["systemctl", "stop", "himmelblaud-tasks"],
+        ], timeout=60)
+    except:
+        pass  # Services might not exist
+    
+    report(first_step + 1, "Disabling services...")
+    try:
+        run_batch_with_sudo([
+            ["systemctl", "disable", "himmelblaud"],
+            ["systemctl", "disable", "himmelblaud-tasks"],
+        ], timeout=60)
+    except:
+        pass
+
+
+def _restore_config(report) -> tuple[bool, str]:
+    """Restore the configs backed up during enrollment (runs off the GUI thread)"""
+    # Step 1-2: Stop and disable services
+    _stop_and_disable_services(report, 1)
+    
+    # Step 3: Restore NSS config
+    report(3, "Restoring NSS configuration...")
+    backups = _backup_state()
+    if "NSS" in backups:
+        run_with_sudo(["cp", "/etc/nsswitch.conf.backup", "/etc/nsswitch.conf"], timeout=10)
+    else:
+        print("Warning: NSS backup not found")
+    
+    # Step 4: Restore PAM config
+    report(4, "Restoring PAM configuration...")
+    if "PAM" in backups:
+        run_with_sudo(["cp", "/etc/pam.d/system-auth.backup", "/etc/pam.d/system-auth"], timeout=10)
+    else:
+        print("Warning: PAM backup not found")
+    
+    # Step 5: Update status
+    report(5, "Updating status...")
+    return True, ""
+
+
+def _uninstall_all(report) -> tuple[bool, str]:
+    """Remove every Himmelblau component (runs off the GUI thread)"""
+    # Step 1-2: Stop services
+    _stop_and_disable_services(report, 1)
+    
+    # Step 3: Remove service files
+    report(3, "Removing systemd service files...")
+    run_batch_with_sudo([
+        ["rm", "-f", "/etc/systemd/system/himmelblaud.service"],
+        ["rm", "-f", "/etc/systemd/system/himmelblaud-tasks.service"],
+        ["rm", "-f", "/usr/share/dbus-1/services/com.microsoft.identity.broker1.service"],
+        ["systemctl", "daemon-reload"],
+    ], timeout=20)
+    
+    # Step 4: Restore configs
+    report(4, "Restoring original configurations...")
+    backups = _backup_state()
+    if "NSS" in backups:
+        run_with_sudo(["cp", "/etc/nsswitch.conf.backup", "/etc/nsswitch.conf"], timeout=10)
+    if "PAM" in backups:
+        run_with_sudo(["cp", "/etc/pam.d/system-auth.backup", "/etc/pam.d/system-auth"], timeout=10)
+    
+    # Step 5: Remove config directory
+    report(5, "Removing Himmelblau configuration...")
+    run_with_sudo(["rm", "-rf", "/etc/himmelblau"], timeout=10)
+    
+    # Step 6-7: Remove binaries
+    report(6, "Removing binaries (1/2)...")
+    run_with_sudo(["rm", "-f", "/usr/sbin/himmelblaud", "/usr/sbin/himmelblaud_tasks",
+                   "/usr/bin/aad-tool", "/usr/sbin/broker"], timeout=10)
+    
+    report(7, "Removing binaries (2/2)...")
+    run_with_sudo(["rm", "-f", "/usr/bin/linux-entra-sso", "/usr/lib/security/pam_himmelblau.so",
+                   "/usr/lib/libnss_himmelblau.so.2"], timeout=10)
+    
+    # Step 8: Remove cache directories
+    report(8, "Removing cache directories...")
+    run_with_sudo(["rm", "-rf", "/var/cache/nss-himmelblau", "/var/cache/himmelblau-policies"], timeout=10)
+    
+    # Step 9: Remove build directories
+    report(9, "Removing build directories...")
+    import shutil
+    build_dirs = [Path("/tmp/himmelblau"), Path("/tmp/himmelblau-services")]
+    for build_dir in build_dirs:
+        if build_dir.exists():
+            shutil.rmtree(build_dir, ignore_errors=True)
+    
+    # Step 10: Remove build dependencies
+    report(10, "Removing build dependencies...")
+    
+    # Remove Himmelblau-specific build deps
+    build_deps = ["rust", "cargo", "tpm2-tss"]
+    for dep in build_deps:
+        try:
+            run_with_sudo(["pacman", "-R", "--noconfirm", dep], timeout=60)
+        except:
+            pass  # Ignore if package not installed
+    
+    # Step 11: Update status
+    report(11, "Finalizing...")
+    return True, ""
 
 
 class SettingsView(QWidget):
     """Settings management view - compact single-screen layout"""
     
     config_changed = pyqtSignal()
+    status_requested = pyqtSignal(bool)  # Check backups too
     
     def __init__(self):
         super().__init__()
+        # Status checks run on one long-lived thread, at most once per STATUS_CACHE_TTL
+        self._status_checked = 0.0
+        self._status_busy = False
+        self._status_recheck = False
+        self.backup_badge = None  # Created with the advanced sections
+        self._commands = set()  # CommandRunnables still running
+        self._status_thread = QThread(self)
+        self._status_worker = StatusWorker()
+        self._status_worker.moveToThread(self._status_thread)
+        self.status_requested.connect(self._status_worker.run)
+        self._status_worker.finished.connect(self.on_status_checked)
+        self._status_thread.finished.connect(self._status_worker.deleteLater)
+        QApplication.instance().aboutToQuit.connect(self._stop_status_thread)
+        self._status_thread.start()
+        
         self.init_ui()
         self.load_settings()
     
@@ -67,7 +349,7 @@ class SettingsView(QWidget):
         # Header
         header = QHBoxLayout()
         title = QLabel("Settings")
-        title.setStyleSheet("font-size: 24px; font-weight: 600; ")
+        title.setObjectName("viewTitle")
         header.addWidget(title)
         header.addStretch()
         main.addLayout(header)
@@ -82,24 +364,19 @@ class SettingsView(QWidget):
         
         # EntraID Section
         section1 = QLabel("EntraID Configuration")
-        section1.setStyleSheet("font-size: 13px; font-weight: 600; color: palette(highlight); text-transform: uppercase; letter-spacing: 0.5px;")
+        section1.setObjectName("sectionHeader")
         left.addWidget(section1)
         
         # Domain
         domain_row = QHBoxLayout()
         domain_lbl = QLabel("Domain")
-        domain_lbl.setStyleSheet("font-size: 13px; ")
+        domain_lbl.setObjectName("fieldLabel")
         domain_lbl.setFixedWidth(80)
         domain_row.addWidget(domain_lbl)
         
         self.domain_input = QLineEdit()
         self.domain_input.setPlaceholderText("company.onmicrosoft.com")
-        self.domain_input.setStyleSheet("""
-            QLineEdit {
-                background: palette(base); border: 1px solid palette(mid); border-radius: 4px;
-                padding: 6px 10px; font-size: 13px;             }
-            QLineEdit:focus { border: 2px solid palette(highlight); padding: 5px 9px; }
-        """)
+        self.domain_input.setObjectName("domainInput")
         domain_row.addWidget(self.domain_input)
         left.addLayout(domain_row)
         
@@ -111,7 +388,7 @@ class SettingsView(QWidget):
         
         # Options Section
         section2 = QLabel("Options")
-        section2.setStyleSheet("font-size: 13px; font-weight: 600; color: palette(highlight); text-transform: uppercase; letter-spacing: 0.5px;")
+        section2.setObjectName("sectionHeader")
         left.addWidget(section2)
         
         self.debug_checkbox = QCheckBox("Enable debug logging")
@@ -126,7 +403,7 @@ class SettingsView(QWidget):
         # Vertical separator
         vsep = QFrame()
         vsep.setFrameShape(QFrame.Shape.VLine)
-        vsep.setStyleSheet("background-color: palette(mid);")
+        vsep.setObjectName("columnSeparator")
         vsep.setFixedWidth(1)
         columns.addWidget(vsep)
         
@@ -136,13 +413,13 @@ class SettingsView(QWidget):
         
         # Services Section
         section3 = QLabel("Services")
-        section3.setStyleSheet("font-size: 13px; font-weight: 600; color: palette(highlight); text-transform: uppercase; letter-spacing: 0.5px;")
+        section3.setObjectName("sectionHeader")
         right.addWidget(section3)
         
         # Status row
         status_row = QHBoxLayout()
         status_lbl = QLabel("Himmelblaud")
-        status_lbl.setStyleSheet("font-size: 13px; ")
+        status_lbl.setObjectName("fieldLabel")
         status_row.addWidget(status_lbl)
         status_row.addStretch()
         self.service_badge = StatusBadge('neutral', '...')
@@ -155,31 +432,19 @@ class SettingsView(QWidget):
         
         self.restart_btn = QPushButton("Restart")
         self.restart_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.restart_btn.setStyleSheet("""
-            QPushButton { background: palette(highlight); color: palette(highlighted-text); border: none; border-radius: 4px;
-                padding: 6px 16px; font-size: 12px; font-weight: 600; }
-            QPushButton:hover { background: palette(dark); }
-        """)
+        self.restart_btn.setProperty("class", "solid")
         self.restart_btn.clicked.connect(self.restart_services)
         svc_btns.addWidget(self.restart_btn)
         
         self.stop_btn = QPushButton("Stop")
         self.stop_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.stop_btn.setStyleSheet("""
-            QPushButton { background: transparent; color: palette(link-visited); border: 1px solid palette(link-visited);
-                border-radius: 4px; padding: 6px 16px; font-size: 12px; font-weight: 600; }
-            QPushButton:hover { background: palette(midlight); }
-        """)
+        self.stop_btn.setProperty("class", "danger")
         self.stop_btn.clicked.connect(self.stop_services)
         svc_btns.addWidget(self.stop_btn)
         
         self.verify_btn = QPushButton("Verify")
         self.verify_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.verify_btn.setStyleSheet("""
-            QPushButton { background: transparent;  border: 1px solid palette(mid);
-                border-radius: 4px; padding: 6px 16px; font-size: 12px; font-weight: 600; }
-            QPushButton:hover { background: palette(midlight); }
-        """)
+        self.verify_btn.setProperty("class", "outline")
         self.verify_btn.clicked.connect(self.verify_status)
         svc_btns.addWidget(self.verify_btn)
         
@@ -188,10 +453,59 @@ class SettingsView(QWidget):
         
         right.addSpacing(8)
         
+        # Advanced and backup sections are rarely needed - built on first request
+        self.advanced_stack = QStackedWidget()
+        placeholder = QWidget()
+        placeholder_layout = QHBoxLayout(placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        show_advanced_btn = QToolButton()
+        show_advanced_btn.setText("Show advanced options")
+        show_advanced_btn.setObjectName("showAdvancedButton")
+        show_advanced_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        show_advanced_btn.clicked.connect(self.show_advanced)
+        placeholder_layout.addWidget(show_advanced_btn)
+        placeholder_layout.addStretch()
+        self.advanced_stack.addWidget(placeholder)
+        right.addWidget(self.advanced_stack)
+        
+        right.addStretch()
+        columns.addLayout(right, 1)
+        
+        main.addLayout(columns, 1)
+        
+        # Bottom save button
+        main.addSpacing(8)
+        
+        bottom = QHBoxLayout()
+        bottom.addStretch()
+        
+        self.save_btn = QPushButton("Save Settings")
+        self.save_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.save_btn.setProperty("class", "solid")
+        self.save_btn.setProperty("size", "large")
+        self.save_btn.clicked.connect(self.save_settings)
+        bottom.addWidget(self.save_btn)
+        
+        main.addLayout(bottom)
+    
+    def show_advanced(self):
+        """Build the advanced and backup sections and show them instead of the placeholder"""
+        if self.backup_badge is None:
+            self.advanced_stack.addWidget(self._create_advanced_page())
+        self.advanced_stack.setCurrentIndex(1)
+        self.update_status(force=True)  # Backups weren't checked until now
+    
+    def _create_advanced_page(self) -> QWidget:
+        """Advanced aad-tool actions and the backup & recovery section"""
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        page_layout.setSpacing(16)
+        
         # Advanced Section (native aad-tool features)
         section4 = QLabel("Advanced")
-        section4.setStyleSheet("font-size: 13px; font-weight: 600; color: palette(highlight); text-transform: uppercase; letter-spacing: 0.5px;")
-        right.addWidget(section4)
+        section4.setObjectName("sectionHeader")
+        page_layout.addWidget(section4)
         
         # Advanced action buttons
         adv_btns = QHBoxLayout()
@@ -200,32 +514,24 @@ class SettingsView(QWidget):
         self.enum_btn = QPushButton("Enumerate Users")
         self.enum_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.enum_btn.setToolTip("Pre-cache EntraID users and groups")
-        self.enum_btn.setStyleSheet("""
-            QPushButton { background: transparent; color: palette(highlight); border: 1px solid palette(highlight);
-                border-radius: 4px; padding: 6px 12px; font-size: 12px; font-weight: 600; }
-            QPushButton:hover { background: palette(midlight); }
-        """)
+        self.enum_btn.setProperty("class", "accent")
         self.enum_btn.clicked.connect(self.enumerate_users)
         adv_btns.addWidget(self.enum_btn)
         
         self.tpm_btn = QPushButton("TPM Status")
         self.tpm_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.tpm_btn.setToolTip("Check TPM hardware status")
-        self.tpm_btn.setStyleSheet("""
-            QPushButton { background: transparent; color: palette(highlight); border: 1px solid palette(highlight);
-                border-radius: 4px; padding: 6px 12px; font-size: 12px; font-weight: 600; }
-            QPushButton:hover { background: palette(midlight); }
-        """)
+        self.tpm_btn.setProperty("class", "accent")
         self.tpm_btn.clicked.connect(self.check_tpm)
         adv_btns.addWidget(self.tpm_btn)
         
         adv_btns.addStretch()
-        right.addLayout(adv_btns)
+        page_layout.addLayout(adv_btns)
         
         # Offline breakglass
         breakglass_row = QHBoxLayout()
         breakglass_lbl = QLabel("Offline Mode")
-        breakglass_lbl.setStyleSheet("font-size: 13px; ")
+        breakglass_lbl.setObjectName("fieldLabel")
         breakglass_lbl.setToolTip("Emergency offline authentication when Entra ID unreachable")
         breakglass_row.addWidget(breakglass_lbl)
         breakglass_row.addStretch()
@@ -233,140 +539,132 @@ class SettingsView(QWidget):
         self.breakglass_btn = QPushButton("Enable 2h")
         self.breakglass_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.breakglass_btn.setToolTip("Enable offline breakglass for 2 hours")
-        self.breakglass_btn.setStyleSheet("""
-            QPushButton { background: transparent; color: palette(bright-text); border: 1px solid palette(bright-text);
-                border-radius: 4px; padding: 4px 10px; font-size: 11px; font-weight: 600; }
-            QPushButton:hover { background: palette(midlight); }
-        """)
+        self.breakglass_btn.setProperty("class", "warning")
+        self.breakglass_btn.setProperty("size", "small")
         self.breakglass_btn.clicked.connect(lambda: self.set_breakglass("2h"))
         breakglass_row.addWidget(self.breakglass_btn)
         
         self.breakglass_off_btn = QPushButton("Disable")
         self.breakglass_off_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.breakglass_off_btn.setStyleSheet("""
-            QPushButton { background: transparent;  border: 1px solid palette(mid);
-                border-radius: 4px; padding: 4px 10px; font-size: 11px; font-weight: 600; }
-            QPushButton:hover { background: palette(midlight); }
-        """)
+        self.breakglass_off_btn.setProperty("class", "outline")
+        self.breakglass_off_btn.setProperty("size", "small")
         self.breakglass_off_btn.clicked.connect(lambda: self.set_breakglass("0"))
         breakglass_row.addWidget(self.breakglass_off_btn)
         
-        right.addLayout(breakglass_row)
+        page_layout.addLayout(breakglass_row)
         
-        right.addSpacing(8)
+        page_layout.addSpacing(8)
         
         # Backup Section
         section5 = QLabel("Backup & Recovery")
-        section5.setStyleSheet("font-size: 13px; font-weight: 600; color: palette(highlight); text-transform: uppercase; letter-spacing: 0.5px;")
-        right.addWidget(section5)
+        section5.setObjectName("sectionHeader")
+        page_layout.addWidget(section5)
         
         # Backup status
         backup_row = QHBoxLayout()
         backup_lbl = QLabel("Backups")
-        backup_lbl.setStyleSheet("font-size: 13px; ")
+        backup_lbl.setObjectName("fieldLabel")
         backup_row.addWidget(backup_lbl)
         backup_row.addStretch()
         self.backup_badge = StatusBadge('neutral', '...')
         backup_row.addWidget(self.backup_badge)
-        right.addLayout(backup_row)
+        page_layout.addLayout(backup_row)
         
         # Restore and Uninstall buttons
         restore_row = QHBoxLayout()
         
         self.restore_btn = QPushButton("Restore Config")
         self.restore_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.restore_btn.setStyleSheet("""
-            QPushButton { background: transparent; color: palette(link-visited); border: 1px solid palette(link-visited);
-                border-radius: 4px; padding: 6px 16px; font-size: 12px; font-weight: 600; }
-            QPushButton:hover { background: palette(midlight); }
-        """)
+        self.restore_btn.setProperty("class", "danger")
         self.restore_btn.clicked.connect(self.restore_backups)
         restore_row.addWidget(self.restore_btn)
         
         self.uninstall_btn = QPushButton("Full Uninstall")
         self.uninstall_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.uninstall_btn.setStyleSheet("""
-            QPushButton { background: transparent; color: #d32f2f; border: 1px solid #d32f2f;
-                border-radius: 4px; padding: 6px 16px; font-size: 12px; font-weight: 600; }
-            QPushButton:hover { background: #ffebee; }
-        """)
+        self.uninstall_btn.setProperty("class", "destructive")
         self.uninstall_btn.clicked.connect(self.full_uninstall)
         restore_row.addWidget(self.uninstall_btn)
         
         restore_row.addStretch()
-        right.addLayout(restore_row)
-        
-        right.addStretch()
-        columns.addLayout(right, 1)
-        
-        main.addLayout(columns, 1)
-        
-        # Bottom save button
-        main.addSpacing(8)
+        page_layout.addLayout(restore_row)
         
-        bottom = QHBoxLayout()
-        bottom.addStretch()
-        
-        self.save_btn = QPushButton("Save Settings")
-        self.save_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.save_btn.setStyleSheet("""
-            QPushButton { background: palette(highlight); color: palette(highlighted-text); border: none; border-radius: 4px;
-                padding: 10px 32px; font-size: 14px; font-weight: 600; }
-            QPushButton:hover { background: palette(dark); }
-        """)
-        self.save_btn.clicked.connect(self.save_settings)
-        bottom.addWidget(self.save_btn)
-        
-        main.addLayout(bottom)
+        return page
     
     def load_settings(self):
         """Load settings from config"""
-        config = Path("/etc/himmelblau/himmelblau.conf")
-        if config.exists():
-            try:
-                for line in config.read_text().splitlines():
-                    if '=' in line and not line.strip().startswith('#'):
-                        k, v = line.split('=', 1)
-                        k, v = k.strip(), v.strip()
-                        if k == 'domains': self.domain_input.setText(v)
-                        elif k == 'local_groups': self.sudo_checkbox.setChecked('wheel' in v)
-                        elif k == 'debug': self.debug_checkbox.setChecked(v.lower() == 'true')
-                        elif k == 'apply_policy': self.policy_checkbox.setChecked(v.lower() == 'true')
-            except: pass
-        
-        self.update_service_status()
-        self.update_backup_status()
-    
-    def update_service_status(self):
+        setters = {
+            'domains': self.domain_input.setText,
+            'local_groups': lambda v: self.sudo_checkbox.setChecked('wheel' in v),
+            'debug': lambda v: self.debug_checkbox.setChecked(v.lower() == 'true'),
+            'apply_policy': lambda v: self.policy_checkbox.setChecked(v.lower() == 'true'),
+        }
         try:
-            r = subprocess.run(["systemctl", "is-active", "himmelblaud"], capture_output=True, text=True, timeout=5)
-            if r.returncode == 0:
-                self.service_badge.set_status('success', 'Running')
-            else:
-                self.service_badge.set_status('error', 'Stopped')
-        except:
-            self.service_badge.set_status('neutral', 'Unknown')
+            text = CONFIG_PATH.read_text()
+        except OSError:
+            text = ""  # Not enrolled yet
+        for k, v in _CONF_RE.findall(text):
+            setters[k](v)
+        
+        self.update_status()
+    
+    def update_status(self, force: bool = False):
+        """Check service and backup status in the background unless checked just now"""
+        if self._status_busy:
+            # The running check may predate the change - check again once it is done
+            self._status_recheck = self._status_recheck or force
+            return
+        if not force and time.monotonic() - self._status_checked < STATUS_CACHE_TTL:
+            return
+        self._status_busy = True
+        self.status_requested.emit(self.backup_badge is not None)
     
-    def update_backup_status(self):
-        b = []
-        if Path("/etc/nsswitch.conf.backup").exists(): b.append("NSS")
-        if Path("/etc/pam.d/system-auth.backup").exists(): b.append("PAM")
-        if b:
-            self.backup_badge.set_status('success', ', '.join(b))
+    def on_status_checked(self, running, backups):
+        """Show the result of a status check"""
+        self._status_busy = False
+        self._status_checked = time.monotonic()
+        
+        if running is None:
+            self.service_badge.set_status('neutral', 'Unknown')
+        elif running:
+            self.service_badge.set_status('success', 'Running')
+        else:
+            self.service_badge.set_status('error', 'Stopped')
+        
+        if backups is None or self.backup_badge is None:
+            pass  # Advanced sections not shown
+        elif backups:
+            self.backup_badge.set_status('success', ', '.join(backups))
         else:
             self.backup_badge.set_status('neutral', 'None')
+        
+        if self._status_recheck:
+            self._status_recheck = False
+            self.update_status(force=True)
+    
+    def _stop_status_thread(self):
+        """Let the status thread finish before the application exits"""
+        self._status_thread.quit()
+        self._status_thread.wait()
+    
+    def _run_async(self, argv: list[str], on_done, timeout: float = 5, privileged: bool = False):
+        """Run a command on the thread pool; on_done(success, message) is called on the GUI thread"""
+        runnable = CommandRunnable(argv, timeout, privileged)
+        # Keep the runnable (and its signals) alive until it is done
+        self._commands.add(runnable)
+        runnable.signals.finished.connect(on_done)
+        runnable.signals.finished.connect(lambda *_: self._commands.discard(runnable))
+        QThreadPool.globalInstance().start(runnable)
     
     def verify_status(self):
-        try:
-            r = subprocess.run(["/usr/bin/aad-tool", "status"], capture_output=True, text=True, timeout=5)
-            if r.returncode == 0 and "working" in r.stdout.lower():
-                QMessageBox.information(self, "Status", f"✓ EntraID working!\n\n{r.stdout}")
-            else:
-                QMessageBox.warning(self, "Status", f"Issue detected:\n\n{r.stdout or r.stderr}")
-        except FileNotFoundError:
-            QMessageBox.warning(self, "Error", "aad-tool not found")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", str(e))
+        self.verify_btn.setEnabled(False)
+        self._run_async(["/usr/bin/aad-tool", "status"], self.on_verify_finished)
+    
+    def on_verify_finished(self, success: bool, message: str):
+        self.verify_btn.setEnabled(True)
+        if success and "working" in message.lower():
+            QMessageBox.information(self, "Status", f"✓ EntraID working!\n\n{message}")
+        else:
+            QMessageBox.warning(self, "Status", f"Issue detected:\n\n{message}")
     
     def save_settings(self):
         domain = self.domain_input.text().strip()
@@ -389,29 +687,87 @@ apply_policy = {"true" if self.policy_checkbox.isChecked() else "false"}
             with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
                 f.write(cfg)
                 tmp = f.name
-            subprocess.run(["sudo", "cp", tmp, "/etc/himmelblau/himmelblau.conf"], check=True, timeout=10)
-            Path(tmp).unlink(missing_ok=True)
+        except OSError as e:
+            QMessageBox.warning(self, "Error", str(e))
+            return
+        
+        self.save_btn.setEnabled(False)
+        # Stage next to the config and rename over it - readers never see a partial file
+        self._run_async(["sh", "-c", _REPLACE_CONFIG_SH, "sh", tmp, str(CONFIG_PATH)],
+                        lambda success, message: self.on_save_finished(tmp, success, message),
+                        timeout=10, privileged=True)
+    
+    def on_save_finished(self, tmp: str, success: bool, message: str):
+        Path(tmp).unlink(missing_ok=True)
+        self.save_btn.setEnabled(True)
+        if success:
             QMessageBox.information(self, "Saved", "Settings saved. Restart services to apply.")
             self.config_changed.emit()
-        except Exception as e:
-            QMessageBox.warning(self, "Error", str(e))
+        else:
+            QMessageBox.warning(self, "Error", message)
     
     def restart_services(self):
-        try:
-            subprocess.run(["sudo", "systemctl", "restart", "himmelblaud"], check=True, timeout=30)
-            self.update_service_status()
+        self.restart_btn.setEnabled(False)
+        self._run_async(["systemctl", "restart", "himmelblaud"], self.on_restart_finished,
+                        timeout=30, privileged=True)
+    
+    def on_restart_finished(self, success: bool, message: str):
+        self.restart_btn.setEnabled(True)
+        self.update_status(force=True)
+        if success:
             QMessageBox.information(self, "Done", "Services restarted")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", str(e))
+        else:
+            QMessageBox.warning(self, "Error", message)
     
     def stop_services(self):
         if QMessageBox.question(self, "Stop?", "Stop services? EntraID login will not work.",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No) == QMessageBox.StandardButton.Yes:
-            try:
-                subprocess.run(["sudo", "systemctl", "stop", "himmelblaud"], check=True, timeout=30)
-                self.update_service_status()
-            except Exception as e:
-                QMessageBox.warning(self, "Error", str(e))
+            self.stop_btn.setEnabled(False)
+            self._run_async(["systemctl", "stop", "himmelblaud"], self.on_stop_finished,
+                            timeout=30, privileged=True)
+    
+    def on_stop_finished(self, success: bool, message: str):
+        self.stop_btn.setEnabled(True)
+        self.update_status(force=True)
+        if not success:
+            QMessageBox.warning(self, "Error", message)
+    
+    def _confirm_sudo(self) -> bool:
+        """Ask for the sudo password unless the session already has it"""
+        from .dialogs import SudoPasswordDialog
+        
+        if get_sudo_helper().validated:
+            return True
+        sudo_dialog = SudoPasswordDialog(self)
+        return sudo_dialog.exec() == SudoPasswordDialog.DialogCode.Accepted
+    
+    def _show_progress(self, title: str, label: str, steps: int) -> QProgressDialog:
+        """Modal progress dialog without a cancel button"""
+        progress = QProgressDialog(label, None, 0, steps, self)
+        progress.setWindowTitle(title)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setCancelButton(None)
+        progress.setMinimumDuration(0)
+        progress.setAutoClose(False)
+        progress.show()
+        return progress
+    
+    def _run_task(self, func, on_done, progress: QProgressDialog | None = None):
+        """
+        Run func(report) on the thread pool
+        
+        report(step, label) moves the progress dialog along; on_done(success,
+        message) is called on the GUI thread.
+        """
+        runnable = TaskRunnable(func)
+        # Keep the runnable (and its signals) alive until it is done
+        self._commands.add(runnable)
+        if progress is not None:
+            runnable.signals.progress.connect(lambda step, _label: progress.setValue(step))
+            runnable.signals.progress.connect(lambda _step, label: progress.setLabelText(label))
+        runnable.signals.finished.connect(on_done)
+        runnable.signals.finished.connect(lambda *_: self._commands.discard(runnable))
+        QThreadPool.globalInstance().start(runnable)
     
     def restore_backups(self):
         """Restore original configuration with progress dialog"""
@@ -421,80 +777,26 @@ apply_policy = {"true" if self.policy_checkbox.isChecked() else "false"}
             return
         
         # First, prompt for sudo password
-        from .dialogs import SudoPasswordDialog
-        from ..utils.sudo_helper import get_sudo_helper
-        
-        sudo_helper = get_sudo_helper()
-        if not sudo_helper.validated:
-            sudo_dialog = SudoPasswordDialog(self)
-            if sudo_dialog.exec() != SudoPasswordDialog.DialogCode.Accepted:
-                return  # User cancelled password prompt
+        if not self._confirm_sudo():
+            return  # User cancelled password prompt
         
         # Create progress dialog with detailed steps
-        progress = QProgressDialog("Restoring configuration...", None, 0, 5, self)
-        progress.setWindowTitle("Restoring Configuration")
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.setCancelButton(None)
-        progress.setMinimumDuration(0)
-        progress.setAutoClose(False)
-        progress.show()
-        QApplication.processEvents()
-        
-        try:
-            # Step 1: Stop services
-            progress.setValue(1)
-            progress.setLabelText("Stopping Himmelblau services...")
-            QApplication.processEvents()
-            try:
-                run_with_sudo(["systemctl", "stop", "himmelblaud"], timeout=30)
-                run_with_sudo(["systemctl", "stop", "himmelblaud-tasks"], timeout=30)
-            except:
-                pass  # Services might not exist
-            
-            # Step 2: Disable services
-            progress.setValue(2)
-            progress.setLabelText("Disabling services...")
-            QApplication.processEvents()
-            try:
-                run_with_sudo(["systemctl", "disable", "himmelblaud"], timeout=30)
-                run_with_sudo(["systemctl", "disable", "himmelblaud-tasks"], timeout=30)
-            except:
-                pass
-            
-            # Step 3: Restore NSS config
-            progress.setValue(3)
-            progress.setLabelText("Restoring NSS configuration...")
-            QApplication.processEvents()
-            if Path("/etc/nsswitch.conf.backup").exists():
-                run_with_sudo(["cp", "/etc/nsswitch.conf.backup", "/etc/nsswitch.conf"], timeout=10)
-            else:
-                print("Warning: NSS backup not found")
-            
-            # Step 4: Restore PAM config
-            progress.setValue(4)
-            progress.setLabelText("Restoring PAM configuration...")
-            QApplication.processEvents()
-            if Path("/etc/pam.d/system-auth.backup").exists():
-                run_with_sudo(["cp", "/etc/pam.d/system-auth.backup", "/etc/pam.d/system-auth"], timeout=10)
-            else:
-                print("Warning: PAM backup not found")
-            
-            # Step 5: Update status
-            progress.setValue(5)
-            progress.setLabelText("Updating status...")
-            QApplication.processEvents()
-            self.update_service_status()
-            
-            progress.close()
+        progress = self._show_progress("Restoring Configuration", "Restoring configuration...", 5)
+        self._run_task(_restore_config,
+                       lambda success, message: self.on_restore_finished(progress, success, message),
+                       progress)
+    
+    def on_restore_finished(self, progress: QProgressDialog, success: bool, message: str):
+        progress.close()
+        self.update_status(force=True)
+        if success:
             QMessageBox.information(self, "Done", 
                 "Configuration restored successfully!\n\n"
                 "EntraID authentication is now disabled.\n\n"
                 "Please RESTART your system to complete the restore.")
-                
-        except Exception as e:
-            progress.close()
+        else:
             QMessageBox.warning(self, "Error", 
-                f"Failed to restore configuration:\n\n{str(e)}\n\n"
+                f"Failed to restore configuration:\n\n{message}\n\n"
                 "Some components may not have been restored.")
     
     def full_uninstall(self):
@@ -521,130 +823,21 @@ apply_policy = {"true" if self.policy_checkbox.isChecked() else "false"}
             return
         
         # First, prompt for sudo password
-        from .dialogs import SudoPasswordDialog
-        from ..utils.sudo_helper import get_sudo_helper
-        
-        sudo_helper = get_sudo_helper()
-        if not sudo_helper.validated:
-            sudo_dialog = SudoPasswordDialog(self)
-            if sudo_dialog.exec() != SudoPasswordDialog.DialogCode.Accepted:
-                return  # User cancelled password prompt
+        if not self._confirm_sudo():
+            return  # User cancelled password prompt
         
         # Create detailed progress dialog (11 steps now with build deps)
-        progress = QProgressDialog("Starting uninstall...", None, 0, 11, self)
-        progress.setWindowTitle("Uninstalling Himmelblau")
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.setCancelButton(None)
-        progress.setMinimumDuration(0)
-        progress.setAutoClose(False)
-        progress.show()
-        QApplication.processEvents()
-        
-        try:
-            from ..core.configurator import SystemConfigurator
-            
-            configurator = SystemConfigurator()
-            
-            # Step 1-2: Stop services
-            progress.setValue(1)
-            progress.setLabelText("Stopping Himmelblau services...")
-            QApplication.processEvents()
-            try:
-                run_with_sudo(["systemctl", "stop", "himmelblaud"], timeout=30)
-                run_with_sudo(["systemctl", "stop", "himmelblaud-tasks"], timeout=30)
-            except:
-                pass  # Services might not exist
-            
-            progress.setValue(2)
-            progress.setLabelText("Disabling services...")
-            QApplication.processEvents()
-            try:
-                run_with_sudo(["systemctl", "disable", "himmelblaud"], timeout=30)
-                run_with_sudo(["systemctl", "disable", "himmelblaud-tasks"], timeout=30)
-            except:
-                pass
-            
-            # Step 3: Remove service files
-            progress.setValue(3)
-            progress.setLabelText("Removing systemd service files...")
-            QApplication.processEvents()
-            run_with_sudo(["rm", "-f", "/etc/systemd/system/himmelblaud.service"], timeout=10)
-            run_with_sudo(["rm", "-f", "/etc/systemd/system/himmelblaud-tasks.service"], timeout=10)
-            run_with_sudo(["rm", "-f", "/usr/share/dbus-1/services/com.microsoft.identity.broker1.service"], timeout=10)
-            run_with_sudo(["systemctl", "daemon-reload"], timeout=10)
-            
-            # Step 4: Restore configs
-            progress.setValue(4)
-            progress.setLabelText("Restoring original configurations...")
-            QApplication.processEvents()
-            if Path("/etc/nsswitch.conf.backup").exists():
-                run_with_sudo(["cp", "/etc/nsswitch.conf.backup", "/etc/nsswitch.conf"], timeout=10)
-            if Path("/etc/pam.d/system-auth.backup").exists():
-                run_with_sudo(["cp", "/etc/pam.d/system-auth.backup", "/etc/pam.d/system-auth"], timeout=10)
-            
-            # Step 5: Remove config directory
-            progress.setValue(5)
-            progress.setLabelText("Removing Himmelblau configuration...")
-            QApplication.processEvents()
-            run_with_sudo(["rm", "-rf", "/etc/himmelblau"], timeout=10)
-            
-            # Step 6-7: Remove binaries
-            progress.setValue(6)
-            progress.setLabelText("Removing binaries (1/2)...")
-            QApplication.processEvents()
-            run_with_sudo(["rm", "-f", "/usr/sbin/himmelblaud"], timeout=10)
-            run_with_sudo(["rm", "-f", "/usr/sbin/himmelblaud_tasks"], timeout=10)
-            run_with_sudo(["rm", "-f", "/usr/bin/aad-tool"], timeout=10)
-            run_with_sudo(["rm", "-f", "/usr/sbin/broker"], timeout=10)
-            
-            progress.setValue(7)
-            progress.setLabelText("Removing binaries (2/2)...")
-            QApplication.processEvents()
-            run_with_sudo(["rm", "-f", "/usr/bin/linux-entra-sso"], timeout=10)
-            run_with_sudo(["rm", "-f", "/usr/lib/security/pam_himmelblau.so"], timeout=10)
-            run_with_sudo(["rm", "-f", "/usr/lib/libnss_himmelblau.so.2"], timeout=10)
-            
-            # Step 8: Remove cache directories
-            progress.setValue(8)
-            progress.setLabelText("Removing cache directories...")
-            QApplication.processEvents()
-            run_with_sudo(["rm", "-rf", "/var/cache/nss-himmelblau"], timeout=10)
-            run_with_sudo(["rm", "-rf", "/var/cache/himmelblau-policies"], timeout=10)
-            
-            # Step 9: Remove build directories
-            progress.setValue(9)
-            progress.setLabelText("Removing build directories...")
-            QApplication.processEvents()
-            import shutil
-            build_dirs = [Path("/tmp/himmelblau"), Path("/tmp/himmelblau-services")]
-            for build_dir in build_dirs:
-                if build_dir.exists():
-                    shutil.rmtree(build_dir, ignore_errors=True)
-            
-            # Step 10: Remove build dependencies
-            progress.setValue(10)
-            progress.setLabelText("Removing build dependencies...")
-            QApplication.processEvents()
-            
-            # Remove Himmelblau-specific build deps
-            build_deps = ["rust", "cargo", "tpm2-tss"]
-            for dep in build_deps:
-                try:
-                    run_with_sudo(["pacman", "-R", "--noconfirm", dep], timeout=60)
-                except:
-                    pass  # Ignore if package not installed
-            
-            # Step 11: Update status
-            progress.setValue(11)
-            progress.setLabelText("Finalizing...")
-            QApplication.processEvents()
-            
-            # Emit signal to refresh main window status
-            self.config_changed.emit()
-            self.update_service_status()
-            
-            progress.close()
-            
+        progress = self._show_progress("Uninstalling Himmelblau", "Starting uninstall...", 11)
+        self._run_task(_uninstall_all,
+                       lambda success, message: self.on_uninstall_finished(progress, success, message),
+                       progress)
+    
+    def on_uninstall_finished(self, progress: QProgressDialog, success: bool, message: str):
+        progress.close()
+        # Emit signal to refresh main window status
+        self.config_changed.emit()
+        self.update_status(force=True)
+        if success:
             QMessageBox.information(self, "Uninstall Complete",
                 "All Himmelblau components have been removed.\n\n"
                 "✓ Services stopped and disabled\n"
@@ -654,11 +847,9 @@ apply_policy = {"true" if self.policy_checkbox.isChecked() else "false"}
                 "✓ Build dependencies removed\n\n"
                 "Please REBOOT your system to complete the uninstall."
             )
-            
-        except Exception as e:
-            progress.close()
+        else:
             QMessageBox.critical(self, "Uninstall Failed", 
-                f"Failed to uninstall:\n\n{str(e)}\n\n"
+                f"Failed to uninstall:\n\n{message}\n\n"
                 "You may need to manually remove components."
             )
     
@@ -683,18 +874,8 @@ apply_policy = {"true" if self.policy_checkbox.isChecked() else "false"}
         self.enum_progress.show()
         QApplication.processEvents()
         
-        # Run in background thread
-        self.enum_worker = AadToolWorker("enumerate")
-        self.enum_thread = QThread()
-        self.enum_worker.moveToThread(self.enum_thread)
-        
-        self.enum_thread.started.connect(self.enum_worker.run)
-        self.enum_worker.finished.connect(self.on_enumerate_finished)
-        self.enum_worker.finished.connect(self.enum_thread.quit)
-        self.enum_worker.finished.connect(self.enum_worker.deleteLater)
-        self.enum_thread.finished.connect(self.enum_thread.deleteLater)
-        
-        self.enum_thread.start()
+        self._run_async(["aad-tool", "enumerate"], self.on_enumerate_finished,
+                        timeout=120, privileged=True)
     
     def on_enumerate_finished(self, success: bool, message: str):
         """Handle enumeration completion"""
@@ -704,7 +885,6 @@ apply_policy = {"true" if self.policy_checkbox.isChecked() else "false"}
             QMessageBox.information(self, "Enumeration", f"✓ {message}")
         else:
             # Clean up error message - remove timestamps and extract meaningful errors
-            import re
             # Remove ANSI color codes
             clean_msg = re.sub(r'\x1b\[[0-9;]*m', '', message)
             # Remove timestamps
@@ -721,12 +901,14 @@ apply_policy = {"true" if self.policy_checkbox.isChecked() else "false"}
                 "Try using 'aad-tool login' from the command line.")
     
     def check_tpm(self):
-        """Check TPM status using native aad-tool"""
+        """Check TPM status using native aad-tool (async)"""
         from ..core.validator import SystemValidator
         
-        validator = SystemValidator()
-        in_use, message = validator.get_tpm_status()
-        
+        self.tpm_btn.setEnabled(False)
+        self._run_task(lambda report: SystemValidator().get_tpm_status(), self.on_tpm_checked)
+    
+    def on_tpm_checked(self, in_use: bool, message: str):
+        self.tpm_btn.setEnabled(True)
         if in_use:
             QMessageBox.information(self, "TPM Status", 
                 f"✓ TPM In Use\n\n{message}\n\n"
@@ -738,7 +920,7 @@ apply_policy = {"true" if self.policy_checkbox.isChecked() else "false"}
                 f"This is normal and secure for most setups.")
     
     def set_breakglass(self, ttl: str):
-        """Set offline breakglass mode using native aad-tool"""
+        """Set offline breakglass mode using native aad-tool (async)"""
         from ..core.validator import SystemValidator
         
         action = "disable" if ttl == "0" else f"enable for {ttl}"
@@ -750,9 +932,14 @@ apply_policy = {"true" if self.policy_checkbox.isChecked() else "false"}
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No) != QMessageBox.StandardButton.Yes:
             return
         
-        validator = SystemValidator()
-        success, message = validator.set_offline_breakglass(ttl)
-        
+        self.breakglass_btn.setEnabled(False)
+        self.breakglass_off_btn.setEnabled(False)
+        self._run_task(lambda report: SystemValidator().set_offline_breakglass(ttl),
+                       self.on_breakglass_finished)
+    
+    def on_breakglass_finished(self, success: bool, message: str):
+        self.breakglass_btn.setEnabled(True)
+        self.breakglass_off_btn.setEnabled(True)
         if success:
             QMessageBox.information(self, "Breakglass", f"✓ {message}")
         else:
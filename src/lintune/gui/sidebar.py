@@ -4,11 +4,35 @@ Sidebar navigation for LinTune
 Microsoft Fluent-style icon navigation
 """
 
+from pathlib import Path
+
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QPushButton, QButtonGroup, QFrame
+    QWidget, QVBoxLayout, QToolButton, QButtonGroup, QFrame, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QByteArray, QSize, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QIcon, QPainter, QPixmap
+from PyQt6.QtSvg import QSvgRenderer
+
+
+ICONS_PATH = Path(__file__).parent.parent / 'resources' / 'icons'
+NAV_ICON_SIZE = QSize(24, 24)
+
+# Icons are rendered at this scale so they stay sharp on HiDPI screens
+_ICON_SCALE = 2
+
+
+def _render_icon(name: str, color: QColor) -> QPixmap:
+    """Render a stroke icon from resources/icons in the given color"""
+    svg = (ICONS_PATH / f"{name}.svg").read_bytes()
+    renderer = QSvgRenderer(QByteArray(svg.replace(b"currentColor", color.name().encode())))
+    
+    pixmap = QPixmap(NAV_ICON_SIZE * _ICON_SCALE)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    renderer.render(painter)
+    painter.end()
+    pixmap.setDevicePixelRatio(_ICON_SCALE)
+    return pixmap
 
 
 class Sidebar(QFrame):
@@ -17,6 +41,9 @@ class Sidebar(QFrame):
     # Signal emitted when navigation changes
     navigation_changed = pyqtSignal(int)
     
+    # Shared by all nav buttons; built on first use, QFont needs a running QApplication
+    _nav_font: QFont | None = None
+    
     def __init__(self):
         super().__init__()
         self.setObjectName("sidebar")
@@ -30,17 +57,21 @@ class Sidebar(QFrame):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
         
+        if Sidebar._nav_font is None:
+            Sidebar._nav_font = QFont()
+            Sidebar._nav_font.setPointSize(9)
+        
         # Button group for exclusive selection
         self.button_group = QButtonGroup()
         self.button_group.setExclusive(True)
         
         # Navigation buttons
         nav_items = [
-            ("🏠", "Dashboard", 0),
-            ("🖥", "Device", 1),
-            ("⚙", "Settings", 2),
-            ("📄", "Logs", 3),
-            ("ℹ", "About", 4),
+            ("dashboard", "Dashboard", 0),
+            ("device", "Device", 1),
+            ("settings", "Settings", 2),
+            ("logs", "Logs", 3),
+            ("about", "About", 4),
         ]
         
         for icon, text, index in nav_items:
@@ -54,31 +85,37 @@ class Sidebar(QFrame):
         # Select first button by default
         self.button_group.button(0).setChecked(True)
     
-    def create_nav_button(self, icon: str, text: str, index: int) -> QPushButton:
+    def create_nav_button(self, icon: str, text: str, index: int) -> QToolButton:
         """
         Create a navigation button
         
         Args:
-            icon: Emoji icon
+            icon: Icon name in resources/icons
             text: Button text
             index: Button index for navigation
             
         Returns:
-            Configured QPushButton
+            Configured QToolButton
         """
-        btn = QPushButton()
+        btn = QToolButton()
         btn.setObjectName("navButton")
         btn.setCheckable(True)
         btn.setToolTip(text)
+        btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         
-        # Button text with icon on top
-        btn_text = f"{icon}\n{text}"
-        btn.setText(btn_text)
+        # Icon on top, text below; checked buttons get the highlighted text color
+        palette = self.palette()
+        nav_icon = QIcon()
+        nav_icon.addPixmap(_render_icon(icon, palette.text().color()),
+                           QIcon.Mode.Normal, QIcon.State.Off)
+        nav_icon.addPixmap(_render_icon(icon, palette.highlightedText().color()),
+                           QIcon.Mode.Normal, QIcon.State.On)
+        btn.setIcon(nav_icon)
+        btn.setIconSize(NAV_ICON_SIZE)
+        btn.setText(text)
+        btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextUnderIcon)
         
-        # Set font for text (icon size controlled by text)
-        font = QFont()
-        font.setPointSize(9)
-        btn.setFont(font)
+        btn.setFont(Sidebar._nav_font)
         
         # Connect click
         btn.clicked.connect(lambda: self.on_button_clicked(index))
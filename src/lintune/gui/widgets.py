@@ -6,7 +6,11 @@ Common UI components used across views.
 
 from PyQt6.QtWidgets import QPushButton, QApplication, QLabel, QHBoxLayout, QWidget
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QCursor
+from PyQt6.QtGui import QColor, QCursor, QPainter, QPixmap
+
+
+# Status dots are drawn at this scale so they stay sharp on HiDPI screens
+_DOT_SCALE = 2
 
 
 class StatusBadge(QWidget):
@@ -26,6 +30,28 @@ class StatusBadge(QWidget):
         'neutral': '#6B7280',   # Gray - unknown, inactive
     }
     
+    # Dot pixmap per status, drawn on first use (QPixmap needs a running QApplication)
+    _pixmaps: dict[str, QPixmap] = {}
+    
+    @classmethod
+    def _get_pixmap(cls, status: str) -> QPixmap:
+        """Colored 16x16 dot for status (neutral for unknown statuses)"""
+        if status not in cls.COLORS:
+            status = 'neutral'
+        pixmap = cls._pixmaps.get(status)
+        if pixmap is None:
+            pixmap = QPixmap(16 * _DOT_SCALE, 16 * _DOT_SCALE)
+            pixmap.setDevicePixelRatio(_DOT_SCALE)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(cls.COLORS[status]))
+            painter.drawEllipse(3, 3, 10, 10)
+            painter.end()
+            cls._pixmaps[status] = pixmap
+        return pixmap
+    
     def __init__(self, status: str = 'neutral', text: str = '', parent=None):
         """
         Create a status badge.
@@ -46,29 +72,26 @@ class StatusBadge(QWidget):
         layout.setSpacing(6)
         
         # Status dot
-        self._dot = QLabel("●")
+        self._dot = QLabel()
         self._dot.setFixedWidth(16)
-        self._update_dot_style()
+        self._dot.setPixmap(self._get_pixmap(self._status))
         layout.addWidget(self._dot)
         
         # Text label (uses palette for text color)
         if self._text:
             self._label = QLabel(self._text)
-            self._label.setStyleSheet("font-size: 13px;")
+            self._label.setObjectName("statusText")
             layout.addWidget(self._label)
         else:
             self._label = None
         
         layout.addStretch()
     
-    def _update_dot_style(self):
-        color = self.COLORS.get(self._status, self.COLORS['neutral'])
-        self._dot.setStyleSheet(f"color: {color}; font-size: 14px;")
-    
     def set_status(self, status: str, text: str = None):
         """Update the badge status and optionally the text."""
-        self._status = status
-        self._update_dot_style()
+        if status != self._status:
+            self._status = status
+            self._dot.setPixmap(self._get_pixmap(status))
         
         if text is not None and self._label:
             self._label.setText(text)
@@ -93,20 +116,17 @@ class StatusDot(QLabel):
     COLORS = StatusBadge.COLORS
     
     def __init__(self, status: str = 'neutral', parent=None):
-        super().__init__("●", parent)
+        super().__init__(parent)
         self._status = status
         self.setFixedWidth(16)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._update_style()
-    
-    def _update_style(self):
-        color = self.COLORS.get(self._status, self.COLORS['neutral'])
-        self.setStyleSheet(f"color: {color}; font-size: 14px;")
+        self.setPixmap(StatusBadge._get_pixmap(status))
     
     def set_status(self, status: str):
         """Update the dot status."""
-        self._status = status
-        self._update_style()
+        if status != self._status:
+            self._status = status
+            self.setPixmap(StatusBadge._get_pixmap(status))
     
     @property
     def status(self) -> str:
@@ -123,42 +143,26 @@ class RefreshButton(QPushButton):
     # Signal emitted when refresh is requested
     refresh_requested = pyqtSignal()
     
+    # Shared by all refresh buttons; built on first use, QCursor needs a running QApplication
+    _point_cursor: QCursor | None = None
+    _wait_cursor: QCursor | None = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._status_timer = None
+        if RefreshButton._point_cursor is None:
+            RefreshButton._point_cursor = QCursor(Qt.CursorShape.PointingHandCursor)
+            RefreshButton._wait_cursor = QCursor(Qt.CursorShape.WaitCursor)
         self._is_refreshing = False
         
-        # Styles - use semantic colors that work in light/dark
-        self._default_style = """
-            QPushButton {
-                background-color: transparent;
-                color: palette(highlight);
-                border: 1px solid palette(highlight);
-                border-radius: 4px;
-                padding: 8px 20px;
-                font-size: 13px;
-                font-weight: 600;
-                min-width: 100px;
-            }
-            QPushButton:hover { background-color: palette(midlight); }
-            QPushButton:disabled { color: palette(mid); border-color: palette(mid); }
-        """
-        self._success_style = """
-            QPushButton {
-                background-color: palette(midlight);
-                color: palette(highlight);
-                border: 1px solid palette(highlight);
-                border-radius: 4px;
-                padding: 8px 20px;
-                font-size: 13px;
-                font-weight: 600;
-                min-width: 100px;
-            }
-        """
+        # Returns the button to its default look after a refresh
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self._reset)
         
+        # Styled by fluent.qss; the "state" property switches to the success look
+        self.setObjectName("refreshButton")
         self.setText("↻ Refresh")
-        self.setStyleSheet(self._default_style)
-        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.setCursor(RefreshButton._point_cursor)
         self.clicked.connect(self._on_clicked)
     
     def _on_clicked(self):
@@ -166,40 +170,46 @@ class RefreshButton(QPushButton):
         if self._is_refreshing:
             return
         
-        # Cancel any pending timer
-        if self._status_timer is not None:
-            self._status_timer.stop()
-            self._status_timer = None
+        # Cancel any pending reset
+        self._status_timer.stop()
         
-        # Emit signal for parent to do actual refresh
+        # Emit signal for parent to do actual refresh; it calls start_refresh()
+        # right away, which disables the button against a second click
         self.refresh_requested.emit()
     
     def start_refresh(self):
         """Call this when starting the refresh operation"""
+        if self._is_refreshing:
+            return  # Already busy - the wait cursor is pushed once
         self._is_refreshing = True
         self.setEnabled(False)
         self.setText("↻ Refreshing...")
-        QApplication.setOverrideCursor(QCursor(Qt.CursorShape.WaitCursor))
-        QApplication.processEvents()
+        QApplication.setOverrideCursor(RefreshButton._wait_cursor)
     
     def finish_refresh(self):
         """Call this when refresh operation is complete"""
-        QApplication.restoreOverrideCursor()
-        self._is_refreshing = False
+        if self._is_refreshing:
+            QApplication.restoreOverrideCursor()
+            self._is_refreshing = False
         self.setEnabled(True)
         self.setText("✓ Updated")
-        self.setStyleSheet(self._success_style)
-        QApplication.processEvents()
+        self._set_state("success")
         
         # Reset button after 2 seconds
-        self._status_timer = QTimer()
-        self._status_timer.setSingleShot(True)
-        self._status_timer.timeout.connect(self._reset)
         self._status_timer.start(2000)
     
     def _reset(self):
         """Reset button to default state"""
         self.setText("↻ Refresh")
-        self.setStyleSheet(self._default_style)
-        self._status_timer = None
+        self._set_state("")
+    
+    def _set_state(self, state: str):
+        """Switch between the default ("") and success looks"""
+        self.setProperty("state", state)
+        self.style().unpolish(self)
+        self.style().polish(self)
+    
+    @property
+    def is_refreshing(self) -> bool:
+        return self._is_refreshing
 
@@ -5,35 +5,74 @@ Writes logs to both console and file for debugging.
 Also captures stderr (Qt warnings) to log file.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
 from pathlib import Path
-from datetime import datetime
 
 
 # Log file location
 LOG_DIR = Path.home() / ".local" / "share" / "lintune"
 LOG_FILE = LOG_DIR / "lintune.log"
 
+# Log records are buffered in memory and written out in batches
+LOG_BUFFER_RECORDS = 200
+# How often buffered log output is written out (ms)
+LOG_FLUSH_INTERVAL_MS = 1000
+
+# Background thread writing the records queued by the "lintune" logger
+_listener: logging.handlers.QueueListener | None = None
+# Exit/crash hooks are installed by the first setup_logging() only
+_hooks_installed = False
+
+
+class TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also writes out every LOG_FLUSH_INTERVAL_MS, from its own thread"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
+    
+    def _flush_periodically(self):
+        while not self._closed.wait(LOG_FLUSH_INTERVAL_MS / 1000):
+            if self.buffer:
+                self.flush()
+    
+    def close(self):
+        self._closed.set()
+        super().close()
+
 
 class StderrCapture:
     """Captures stderr and writes to both original stderr and log file"""
     
+    # Formatted timestamp, reused for every message within the same second
+    _ts_sec = 0
+    _ts_str = ""
+    
     def __init__(self, log_file: Path, original_stderr):
         self.log_file = log_file
         self.original_stderr = original_stderr
-        self.file_handle = open(log_file, 'a', encoding='utf-8')
+        # Line buffered - tracebacks and Qt warnings must be on disk before an abort
+        self.file_handle = open(log_file, 'a', encoding='utf-8', buffering=1)
     
     def write(self, message):
         # Write to original stderr
         self.original_stderr.write(message)
         # Also write to log file (with prefix for Qt messages)
         if message.strip():
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.file_handle.write(f"{timestamp} | STDERR   | qt | {message}")
-            if not message.endswith('\n'):
-                self.file_handle.write('\n')
-            self.file_handle.flush()
+            now = int(time.time())
+            if now != self._ts_sec:
+                self._ts_sec = now
+                self._ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            newline = '' if message.endswith('\n') else '\n'
+            self.file_handle.write(f"{self._ts_str} | STDERR   | qt | {message}{newline}")
     
     def flush(self):
         self.original_stderr.flush()
@@ -64,6 +103,11 @@ def setup_logging(debug: bool = False) -> logging.Logger:
     logger.setLevel(logging.DEBUG if debug else logging.INFO)
     
     # Clear existing handlers
+    global _listener, _hooks_installed
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
     logger.handlers.clear()
     
     # Format
@@ -72,17 +116,39 @@ def setup_logging(debug: bool = False) -> logging.Logger:
         datefmt="%Y-%m-%d %H:%M:%S"
     )
     
-    # File handler - always debug level for troubleshooting
+    # File handler - always debug level for troubleshooting. Records are
+    # collected and written in batches, on the listener thread; errors are
+    # written out immediately
     file_handler = logging.FileHandler(LOG_FILE, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(fmt)
-    logger.addHandler(file_handler)
+    buffered_handler = TimedMemoryHandler(
+        capacity=LOG_BUFFER_RECORDS,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+    buffered_handler.setLevel(logging.DEBUG)
     
     # Console handler
     console_handler = logging.StreamHandler(sys.__stdout__)
     console_handler.setLevel(logging.DEBUG if debug else logging.INFO)
     console_handler.setFormatter(fmt)
-    logger.addHandler(console_handler)
+    
+    # Callers only queue records; formatting and I/O happen on the listener thread
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue, buffered_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    
+    if not _hooks_installed:
+        # atexit runs these last-registered first: drain the queue, then write out
+        atexit.register(flush_logs)
+        atexit.register(_stop_listener)
+        # An unhandled exception in a Qt slot aborts without running atexit
+        sys.excepthook = _flushing_excepthook(sys.excepthook)
+        _hooks_installed = True
     
     # Log startup
     logger.info("=" * 60)
@@ -93,6 +159,34 @@ def setup_logging(debug: bool = False) -> logging.Logger:
     return logger
 
 
+def _stop_listener():
+    """Stop the current listener, writing out the records still queued"""
+    if _listener is not None:
+        _listener.stop()
+
+
+def _flushing_excepthook(excepthook):
+    """Wrap an excepthook so buffered log output is written out first"""
+    def hook(exc_type, exc_value, exc_traceback):
+        flush_logs()
+        excepthook(exc_type, exc_value, exc_traceback)
+    return hook
+
+
+def flush_stderr():
+    """Write out captured stderr (the log records flush on their own thread)"""
+    if isinstance(sys.stderr, StderrCapture):
+        sys.stderr.flush()
+
+
+def flush_logs():
+    """Write out buffered log records and captured stderr"""
+    if _listener is not None:
+        for handler in _listener.handlers:
+            handler.flush()
+    flush_stderr()
+
+
 def get_logger(name: str = "lintune") -> logging.Logger:
     """Get a logger instance"""
     return logging.getLogger(name)
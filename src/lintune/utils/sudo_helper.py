@@ -4,35 +4,37 @@ Sudo helper for LinTune
 Handles elevated privilege execution with password caching.
 """
 
+import os
+import shlex
 import subprocess
-import threading
+import time
 from typing import Optional, List
 from pathlib import Path
 
+# sudo's own timestamp lasts 15 minutes by default; refreshing it more
+# often than this is wasted work
+SUDO_REFRESH_INTERVAL = 60.0
+
+# Command prefix for running with the password read from stdin
+_SUDO_PREFIX = ("sudo", "-S")
+
 
 class SudoHelper:
-    """Helper for running commands with sudo"""
-    
-    _instance = None
-    _lock = threading.Lock()
+    """
+    Helper for running commands with sudo
     
-    def __new__(cls):
-        """Singleton pattern"""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
+    Use get_sudo_helper() rather than creating instances; the module-level
+    instance is the one that holds the cached password.
+    """
     
     def __init__(self):
         """Initialize sudo helper"""
-        if self._initialized:
-            return
-            
-        self.password: Optional[str] = None
+        # Password plus newline, as sudo -S reads it; zeroed by clear()
+        self._password_line: Optional[bytearray] = None
         self.validated = False
-        self._initialized = True
+        # "Grant sudo to domain users?" answers for this session, by domain
+        self.grant_sudo_answers: dict[str, bool] = {}
+        self._last_refresh = 0.0  # Monotonic time the sudo timestamp was last renewed
     
     def set_password(self, password: str) -> bool:
         """
@@ -44,39 +46,60 @@ class SudoHelper:
         Returns:
             True if password is valid
         """
+        password_line = bytearray(password.encode() + b"\n")
         try:
-            # Test password with a simple command
+            # Check the password without running any command; -k ignores
+            # an existing timestamp so the password is really verified
             result = subprocess.run(
-                ["sudo", "-S", "-k", "true"],
-                input=f"{password}\n",
+                ["sudo", "-S", "-k", "-v"],
+                input=bytes(password_line),
                 capture_output=True,
-                text=True,
                 timeout=5
             )
             
             if result.returncode == 0:
-                self.password = password
+                self._forget_password()
+                self._password_line = password_line
                 self.validated = True
                 # Keep sudo timestamp alive
                 subprocess.run(
                     ["sudo", "-S", "-v"],
-                    input=f"{password}\n",
+                    input=bytes(password_line),
                     capture_output=True,
-                    text=True,
                     timeout=5
                 )
+                self._last_refresh = time.monotonic()
                 return True
             else:
-                self.password = None
+                password_line[:] = bytes(len(password_line))
+                self._forget_password()
                 self.validated = False
                 return False
                 
         except Exception as e:
             print(f"Password validation failed: {e}")
-            self.password = None
+            password_line[:] = bytes(len(password_line))
+            self._forget_password()
             self.validated = False
             return False
     
+    @property
+    def password(self) -> Optional[str]:
+        """The validated sudo password, or None"""
+        if self._password_line is None:
+            return None
+        return self._password_line[:-1].decode()
+    
+    def password_input(self) -> bytes:
+        """The password line to feed to `sudo -S` on stdin"""
+        return bytes(self._password_line)
+    
+    def _forget_password(self):
+        """Overwrite and drop the stored password"""
+        if self._password_line is not None:
+            self._password_line[:] = bytes(len(self._password_line))
+            self._password_line = None
+    
     def refresh_sudo(self) -> bool:
         """
         Refresh sudo timestamp to prevent timeout
@@ -84,19 +107,40 @@ class SudoHelper:
         Returns:
             True if successful
         """
-        if not self.validated or not self.password:
+        if not self.validated or self._password_line is None:
             return False
             
         try:
             result = subprocess.run(
                 ["sudo", "-S", "-v"],
-                input=f"{self.password}\n",
+                input=bytes(self._password_line),
                 capture_output=True,
-                text=True,
                 timeout=5
             )
+            if result.returncode == 0:
+                self._last_refresh = time.monotonic()
+                return True
+            return False
+        except (subprocess.SubprocessError, OSError):
+            return False
+    
+    def has_timestamp(self) -> bool:
+        """
+        Check whether sudo's cached credentials are still valid
+        
+        Uses `sudo -vn`, which never prompts and runs no command.
+        
+        Returns:
+            True if sudo would not ask for a password right now
+        """
+        try:
+            result = subprocess.run(
+                ["sudo", "-vn"],
+                capture_output=True,
+                timeout=1
+            )
             return result.returncode == 0
-        except:
+        except Exception:
             return False
     
     def run(self, cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
@@ -110,34 +154,66 @@ class SudoHelper:
         Returns:
             CompletedProcess instance
         """
-        if not self.validated or not self.password:
+        if not self.validated or self._password_line is None:
             raise RuntimeError("Sudo password not set or invalid")
         
-        # Refresh sudo timestamp before long-running commands
-        self.refresh_sudo()
+        # Refresh sudo timestamp before long-running commands, unless done just now
+        if time.monotonic() - self._last_refresh > SUDO_REFRESH_INTERVAL:
+            self.refresh_sudo()
         
         # Prepend sudo -S to command
-        sudo_cmd = ["sudo", "-S"] + cmd
+        sudo_cmd = (*_SUDO_PREFIX, *cmd)
         
-        # Add password to stdin if not already provided
-        if "input" not in kwargs:
-            kwargs["input"] = f"{self.password}\n"
         if "text" not in kwargs:
             kwargs["text"] = True
         if "capture_output" not in kwargs:
             kwargs["capture_output"] = True
+        
+        if "input" in kwargs or "stdin" in kwargs:
+            return subprocess.run(sudo_cmd, **kwargs)
+        
+        # Feed the password through a pipe, whatever the text mode of the output
+        read_fd, write_fd = os.pipe()
+        try:
+            try:
+                os.write(write_fd, self._password_line)
+            finally:
+                os.close(write_fd)
+            return subprocess.run(sudo_cmd, stdin=read_fd, **kwargs)
+        finally:
+            os.close(read_fd)
+    
+    def run_batch(self, cmds: List[List[str]], **kwargs) -> subprocess.CompletedProcess:
+        """
+        Run several commands one after another under a single sudo
+        
+        Every command runs even if an earlier one fails, as with separate
+        run() calls, but sudo (and its PAM session) starts only once.
+        
+        Args:
+            cmds: Commands to run (without sudo prefix)
+            **kwargs: Additional arguments for subprocess.run
             
-        return subprocess.run(sudo_cmd, **kwargs)
+        Returns:
+            CompletedProcess instance (return code of the last command)
+        """
+        script = "; ".join(shlex.join(cmd) for cmd in cmds)
+        return self.run(["sh", "-c", script], **kwargs)
     
     def clear(self):
-        """Clear cached password"""
-        self.password = None
+        """Clear cached password and sudo grant answers"""
+        was_validated = self.validated
+        self._forget_password()
         self.validated = False
+        self.grant_sudo_answers.clear()
+        self._last_refresh = 0.0
         
-        # Clear sudo timestamp
+        # Clear the sudo timestamp, if we ever created one
+        if not was_validated:
+            return
         try:
             subprocess.run(["sudo", "-k"], timeout=5)
-        except:
+        except (subprocess.SubprocessError, OSError):
             pass
 
 
@@ -162,3 +238,17 @@ def run_with_sudo(cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
         CompletedProcess instance
     """
     return _sudo_helper.run(cmd, **kwargs)
+
+
+def run_batch_with_sudo(cmds: List[List[str]], **kwargs) -> subprocess.CompletedProcess:
+    """
+    Convenience function to run several commands under one sudo
+    
+    Args:
+        cmds: Commands to run (without sudo prefix)
+        **kwargs: Additional arguments for subprocess.run
+        
+    Returns:
+        CompletedProcess instance
+    """
+    return _sudo_helper.run_batch(cmds, **kwargs)
@@ -14,16 +14,15 @@ sys.path.insert(0, str(Path(__file__).parent / 'src'))
 def test_distro_detection():
     """Test distro detection"""
     print("Testing distro detection...")
-    from lintune.core.distro import DistroDetector
+    from lintune.core.distro import DistroDetector, detect_distro
     
-    detector = DistroDetector()
-    info = detector.detect()
+    info = detect_distro()
     
     print(f"  ✓ Distribution: {info.name}")
     print(f"  ✓ Version: {info.version}")
     print(f"  ✓ Supported: {info.is_supported}")
     print(f"  ✓ Package Manager: {info.package_manager}")
-    print(f"  ✓ Icon: {detector.get_distro_icon(info)}")
+    print(f"  ✓ Icon: {DistroDetector().get_distro_icon(info)}")
     print()
     
     return info
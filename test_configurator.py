@@ -3,6 +3,7 @@
 Test system configurator (checks only, no actual changes)
 """
 
+import mmap
 import sys
 from pathlib import Path
 
@@ -11,6 +12,16 @@ sys.path.insert(0, str(Path(__file__).parent / 'src'))
 from lintune.core.configurator import SystemConfigurator
 
 
+def file_contains(path: Path, needle: bytes) -> bool:
+    """Search a file for a byte string without decoding it"""
+    with open(path, 'rb') as f:
+        # mmap refuses zero-length files
+        if not f.seek(0, 2):
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(needle) >= 0
+
+
 def main():
     print("=" * 60)
     print("System Configurator Test")
@@ -69,19 +80,13 @@ def main():
     
     # Check NSS configuration
     if configurator.NSS_CONF.exists():
-        with open(configurator.NSS_CONF, 'r') as f:
-            content = f.read()
-        
-        has_himmelblau = 'himmelblau' in content
+        has_himmelblau = file_contains(configurator.NSS_CONF, b'himmelblau')
         status = "✓" if has_himmelblau else "✗"
         print(f"{status} NSS configured for Himmelblau")
     
     # Check PAM configuration
     if configurator.PAM_CONF.exists():
-        with open(configurator.PAM_CONF, 'r') as f:
-            content = f.read()
-        
-        has_himmelblau = 'pam_himmelblau' in content
+        has_himmelblau = file_contains(configurator.PAM_CONF, b'pam_himmelblau')
         status = "✓" if has_himmelblau else "✗"
         print(f"{status} PAM configured for Himmelblau")
     
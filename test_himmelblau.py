@@ -12,10 +12,19 @@ sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from lintune.core.himmelblau import HimmelblauBuilder, BuildProgress
 
+# Block-buffer stdout so frequent progress ticks don't each cost a write
+sys.stdout.reconfigure(line_buffering=False)
+
+_last_status = None
+
 
 def progress_callback(progress: BuildProgress):
-    """Print progress updates"""
+    """Print progress updates, flushing only when the build status changes"""
+    global _last_status
     print(f"[{progress.progress:3d}%] {progress.status.value:12s} - {progress.message}")
+    if progress.status != _last_status:
+        _last_status = progress.status
+        sys.stdout.flush()
 
 
 def main():
@@ -10,12 +10,21 @@ sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from lintune.core.installer import Installer, InstallProgress, InstallStatus
 
+# Block-buffer stdout so frequent progress ticks don't each cost a write
+sys.stdout.reconfigure(line_buffering=False)
+
+_last_step = None
+
 
 def progress_callback(progress: InstallProgress):
-    """Print progress updates"""
+    """Print progress updates, flushing only when the install step changes"""
+    global _last_step
     pct = progress.progress_percent
     step = progress.current_step.value
     print(f"[{pct:3d}%] Step {progress.step_number}/{progress.total_steps}: {step:20s} - {progress.message}")
+    if progress.current_step != _last_step:
+        _last_step = progress.current_step
+        sys.stdout.flush()
 
 
 def main():
@@ -6,11 +6,12 @@ Tests package detection and dependency resolution
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from lintune.core.distro import DistroDetector
+from lintune.core.distro import detect_distro
 from lintune.core.package_manager import (
     get_package_manager, 
     get_himmelblau_dependencies,
@@ -25,8 +26,7 @@ def main():
     print()
     
     # Detect distro
-    detector = DistroDetector()
-    distro_info = detector.detect()
+    distro_info = detect_distro()
     
     print(f"Distribution: {distro_info.display_name}")
     print(f"Supported: {distro_info.is_supported}")
@@ -45,10 +45,15 @@ def main():
     # Test package checking
     print("Checking installed packages:")
     test_packages = ["rust", "cargo", "git", "python"]
+    mapped_packages = [map_package_name(pkg, distro_info.supported) for pkg in test_packages]
+    deps = get_himmelblau_dependencies(distro_info.supported)
+    
+    # Queries are subprocess-bound, so run them concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        packages_installed = list(executor.map(pm.is_installed, mapped_packages))
+        deps_installed = dict(zip(deps, executor.map(pm.is_installed, deps)))
     
-    for pkg in test_packages:
-        mapped = map_package_name(pkg, distro_info.supported)
-        installed = pm.is_installed(mapped)
+    for pkg, mapped, installed in zip(test_packages, mapped_packages, packages_installed):
         status = "✓" if installed else "✗"
         print(f"  {status} {pkg} ({mapped}): {'installed' if installed else 'not installed'}")
     
@@ -56,16 +61,14 @@ def main():
     
     # Show Himmelblau dependencies
     print("Himmelblau dependencies for this distro:")
-    deps = get_himmelblau_dependencies(distro_info.supported)
-    for dep in deps:
-        installed = pm.is_installed(dep)
+    for dep, installed in deps_installed.items():
         status = "✓" if installed else "✗"
         print(f"  {status} {dep}")
     
     print()
     
     # Count installed
-    installed_count = sum(1 for dep in deps if pm.is_installed(dep))
+    installed_count = sum(deps_installed.values())
     print(f"Dependencies: {installed_count}/{len(deps)} installed")
     
     if installed_count == len(deps):